@@ -12,10 +12,95 @@ import json
 import asyncio
 import websockets
 import time
-import base64
+import struct
 import cv2
 import inspect
-from datetime import datetime
+from utils.cpu_affinity import IO_CORES, worker_cores, pin_current_thread
+
+# 可選的 libjpeg-turbo 綁定，用於更快的 JPEG 編碼；編碼器只載入一次，由所有視頻流共享
+# Optional libjpeg-turbo binding for faster JPEG encoding; the encoder is loaded once and shared by all streams
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR, TJSAMP_420
+    _TURBO_JPEG = TurboJPEG()
+    HAVE_TURBOJPEG = True
+except ImportError:
+    _TURBO_JPEG = None
+    HAVE_TURBOJPEG = False
+except Exception as e:
+    # 綁定已安裝但找不到 libturbojpeg 共享庫
+    # Binding is installed but the libturbojpeg shared library could not be found
+    logging.warning(f"Cannot load libjpeg-turbo: {e}")
+    _TURBO_JPEG = None
+    HAVE_TURBOJPEG = False
+
+# 可選的 uvloop 事件循環，比默認 asyncio 循環更快
+# Optional uvloop event loop, faster than the default asyncio loop
+try:
+    import uvloop
+    HAVE_UVLOOP = True
+except ImportError:
+    HAVE_UVLOOP = False
+
+# 可選的 orjson，比標準庫 json 更快
+# Optional orjson, faster than the standard library json
+try:
+    import orjson
+    HAVE_ORJSON = True
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    HAVE_ORJSON = False
+
+# websockets.serve 參數：視頻幀已是JPEG，關閉壓縮；提高寫緩衝上限以容納整幀
+# websockets.serve options: frames are already JPEG, so no compression; raise the write buffer limit to hold whole frames
+_SERVE_OPTIONS = {
+    "compression": None,
+    "max_size": 2 ** 20,     # 接收消息的最大字節數 (Maximum size of an incoming message)
+    "max_queue": 32,         # 接收隊列長度 (Incoming message queue length)
+    "write_limit": 2 ** 20,  # 發送緩衝區高水位 (Outgoing buffer high-water mark)
+}
+
+# 視頻幀二進制頭部，小端序：魔數、版本、標誌、時間戳(毫秒)、寬、高、JPEG長度，其後緊跟JPEG數據
+# Video frame binary header, little-endian: magic, version, flags, timestamp (ms), width, height, JPEG length, followed by the JPEG data
+FRAME_MAGIC = 0xF5
+FRAME_VERSION = 1
+_FRAME_HEADER = struct.Struct("<BBHQHHI")
+
+def _now_ms():
+    """當前時間戳，毫秒整數 (Current timestamp as integer milliseconds)"""
+    return time.time_ns() // 1_000_000
+
+def _dumps(obj):
+    """將對象序列化為JSON文本，保持以文本幀發送
+    Serialize an object to JSON text so it is still sent as a text frame
+    """
+    if HAVE_ORJSON:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode("utf-8")
+    return json.dumps(obj)
+
+# 超過此大小的入站消息在線程池中解析，避免阻塞事件循環
+# Inbound messages larger than this are parsed in the thread pool so they don't block the event loop
+_LARGE_MESSAGE_SIZE = 16 * 1024
+
+def _loads(message):
+    """解析JSON消息 (Parse a JSON message)"""
+    if HAVE_ORJSON:
+        return orjson.loads(message)
+    return json.loads(message)
+
+# 預先序列化的固定消息模板，只需填入可變字段
+# Pre-serialized message templates, only the variable fields are filled in
+_PONG_TEMPLATE = '{"type":"pong","data":{"timestamp":%s,"server_time":%s},"id":%s}'
+_COMMAND_RESPONSE_TEMPLATE = '{"type":"command_response","data":%s,"id":%s}'
+_VIDEO_STARTED_DATA = _dumps({
+    "success": True,
+    "message": "Video streaming started",
+    "message_cht": "視頻流已啟動"
+})
+_VIDEO_STOPPED_DATA = _dumps({
+    "success": True,
+    "message": "Video streaming stopped",
+    "message_cht": "視頻流已停止"
+})
 
 class WebSocketServer:
     """WebSocket服務器類，處理與前端的通訊
@@ -37,14 +122,28 @@ class WebSocketServer:
         
         self.clients = set()
         self.video_clients = set()  # 專門接收視頻流的客戶端集合 (Clients receiving video stream)
+        self.client_queues = {}  # 每個客戶端的發送隊列，由其寫入任務消費 (Per-client send queues, drained by each client's writer task)
+        self.client_queue_size = 8  # 發送隊列長度，滿時丟棄新消息 (Send queue length, new messages are dropped when full)
+        self.client_drops = {}  # 每個客戶端因隊列已滿而丟棄的消息數 (Messages dropped per client because its queue was full)
         self.running = False
         self.server = None
+        self.loop = None  # 服務器事件循環 (Server event loop)
         self.thread = None
         self.video_thread = None  # 視頻流線程 (Video streaming thread)
-        self.lock = threading.Lock()
         self.video_streaming = False  # 視頻流狀態 (Video streaming status)
         self.video_interval = 0.1  # 視頻幀發送間隔，秒 (Video frame sending interval in seconds)
         self.vision_system = None  # 視覺系統實例 (Vision system instance)
+        self.status_cache_ttl = 0.05  # 狀態消息緩存有效期，秒 (Status message cache TTL in seconds)
+        self._status_cache = (0.0, None)  # (緩存時間, 狀態消息JSON) / (cached at, status message JSON)
+        
+        # 服務器自身處理的命令，其他命令轉發到機器人控制器
+        # Commands handled by the server itself, everything else goes to the robot controller
+        self._command_handlers = {
+            "ping": self._cmd_ping,
+            "get_status": self._cmd_get_status,
+            "start_video_stream": self._cmd_start_video_stream,
+            "stop_video_stream": self._cmd_stop_video_stream,
+        }
         
         self.logger.info(f"WebSocket服務器初始化完成 (端口: {port})")
         self.logger.info(f"WebSocket server initialization complete (port: {port})")
@@ -60,26 +159,6 @@ class WebSocketServer:
         self.logger.info("設置視覺系統實例成功")
         self.logger.info("Successfully set vision system instance")
         
-    def _is_connection_closed(self, websocket):
-        """安全地檢查WebSocket連接是否已關閉
-        Safely check if a WebSocket connection is closed
-        
-        Args:
-            websocket: WebSocket連接對象 (WebSocket connection object)
-            
-        Returns:
-            bool: 如果連接已關閉或無效，返回 True (True if connection is closed or invalid)
-        """
-        try:
-            # 嘗試創建一個 ping 任務，但不實際執行
-            # 如果連接已關閉，這會失敗
-            pong_waiter = asyncio.ensure_future(websocket.ping())
-            # 立即取消任務，我們只是檢查是否能創建任務
-            pong_waiter.cancel()
-            return False  # 連接正常
-        except Exception:
-            return True  # 連接已關閉或無效
-    
     def start(self):
         """啟動WebSocket服務器
         Start WebSocket server"""
@@ -145,18 +224,25 @@ class WebSocketServer:
         self.logger.info(f"啟動WebSocket服務器在端口 {self.port}")
         self.logger.info(f"Starting WebSocket server on port {self.port}")
         
-        # 創建新的事件循環
-        # Create new event loop
-        loop = asyncio.new_event_loop()
+        # 創建新的事件循環，可用時使用 uvloop
+        # Create new event loop, using uvloop when available
+        loop = uvloop.new_event_loop() if HAVE_UVLOOP else asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
+        self.loop = loop
+
+        # 將事件循環線程固定到 IO 核心，避免被圖像處理搶佔
+        # Pin the event loop thread to the IO core so image processing never preempts it
+        pin_current_thread(IO_CORES, self.logger)
         
         # 定義啟動服務器的異步函數
         # Define async function to start server
         async def start_server_async():
             try:
                 # 嘗試在指定端口啟動服務器
+                # 關閉 permessage-deflate：視頻幀已是 JPEG 壓縮數據，再壓縮只浪費CPU
                 # Try to start server on specified port
-                return await websockets.serve(self._handle_client, "0.0.0.0", self.port)
+                # Disable permessage-deflate: video frames are already JPEG-compressed, recompressing only wastes CPU
+                return await websockets.serve(self._handle_client, "0.0.0.0", self.port, **_SERVE_OPTIONS)
             except OSError as e:
                 # 端口可能被佔用，記錄錯誤並嘗試使用備用端口
                 # Port might be in use, log error and try fallback port
@@ -169,7 +255,7 @@ class WebSocketServer:
                 self.logger.info(f"嘗試使用備用端口 {fallback_port}")
                 self.logger.info(f"Trying fallback port {fallback_port}")
                 self.port = fallback_port  # 更新端口號
-                return await websockets.serve(self._handle_client, "0.0.0.0", fallback_port)
+                return await websockets.serve(self._handle_client, "0.0.0.0", fallback_port, **_SERVE_OPTIONS)
         
         try:
             # 啟動服務器
@@ -201,12 +287,19 @@ class WebSocketServer:
         """
         # 添加到客戶端集合
         # Add to client set
-        with self.lock:
-            self.clients.add(websocket)
+        # 為客戶端創建發送隊列和寫入任務
+        # Create the client's send queue and writer task
+        queue = asyncio.Queue(maxsize=self.client_queue_size)
+        writer = asyncio.ensure_future(self._writer_loop(websocket, queue))
+        
+        # 客戶端集合只在服務器事件循環中修改，無需加鎖
+        # The client sets are only mutated on the server event loop, so no lock is needed
+        self.client_queues[websocket] = queue
+        self.client_drops[websocket] = 0
+        self.clients.add(websocket)
         
         client_info = f"{websocket.remote_address[0]}:{websocket.remote_address[1]}"
-        self.logger.info(f"新客戶端連接: {client_info}")
-        self.logger.info(f"New client connected: {client_info}")
+        self.logger.info("新客戶端連接 / New client connected: %s", client_info)
         
         try:
             # 發送初始狀態
@@ -217,31 +310,22 @@ class WebSocketServer:
             # Handle client messages
             async for message in websocket:
                 try:
-                    # 記錄原始消息
-                    # Log raw message
-                    self.logger.info(f"收到原始消息: {message}")
-                    self.logger.info(f"Received raw message: {message}")
-                    
                     # 解析JSON
                     # Parse JSON
                     data = None
                     try:
-                        data = json.loads(message)
+                        if len(message) > _LARGE_MESSAGE_SIZE:
+                            data = await asyncio.get_running_loop().run_in_executor(None, _loads, message)
+                        else:
+                            data = _loads(message)
                     except json.JSONDecodeError:
                         self.logger.error("無法解析JSON消息")
                         self.logger.error("Could not parse JSON message")
                         continue
                     
-                    # 記錄解析後的消息
-                    # Log parsed message
-                    self.logger.info(f"解析後的消息數據: {data}")
-                    self.logger.info(f"Parsed message data: {data}")
-                    
                     # 檢查消息類型
                     # Check message type
                     if isinstance(data, dict) and "type" in data:
-                        self.logger.info("發現 type 字段，處理命令")
-                        self.logger.info("Found type field, handling command")
                         await self._handle_command(websocket, data)
                     else:
                         self.logger.warning("未知消息格式，忽略")
@@ -250,132 +334,104 @@ class WebSocketServer:
                     self.logger.error(f"處理消息時出錯: {e}")
                     self.logger.error(f"Error handling message: {e}")
         except websockets.exceptions.ConnectionClosed as e:
-            self.logger.info(f"客戶端連接關閉: {client_info}, 代碼: {e.code}, 原因: {e.reason}")
-            self.logger.info(f"Client connection closed: {client_info}, code: {e.code}, reason: {e.reason}")
+            self.logger.info("客戶端連接關閉 / Client connection closed: %s, 代碼 code: %s, 原因 reason: %s",
+                             client_info, e.code, e.reason)
         except Exception as e:
             self.logger.error(f"處理客戶端時出錯: {e}")
             self.logger.error(f"Error handling client: {e}")
         finally:
             # 從客戶端集合中移除
             # Remove from client set
-            with self.lock:
-                self.clients.discard(websocket)
-                self.video_clients.discard(websocket)
-            
-            self.logger.info(f"客戶端斷開連接: {client_info}")
-            self.logger.info(f"Client disconnected: {client_info}")
+            self.clients.discard(websocket)
+            self.video_clients.discard(websocket)
+            self.client_queues.pop(websocket, None)
+            dropped = self.client_drops.pop(websocket, 0)
+            writer.cancel()
+            
+            if dropped:
+                self.logger.info("客戶端 %s 共丟棄 %d 條消息 / Client %s dropped %d messages",
+                                 client_info, dropped, client_info, dropped)
+            self.logger.info("客戶端斷開連接 / Client disconnected: %s", client_info)
     
     async def _handle_command(self, websocket, data):
-        """處理客戶端命令
+        """處理客戶端命令，服務器自身的命令按類型查表分派，其餘轉發到機器人控制器
+        Handle client command, the server's own commands are dispatched by type, the rest go to the robot controller
         
         Args:
             websocket: WebSocket連接
             data (dict): 命令數據
         """
         command_type = data.get("type", "")
-        command_data = data.get("data", {})
         command_id = data.get("id", "unknown")
         
-        self.logger.info(f"處理命令: {command_type}, ID: {command_id}")
-        self.logger.info(f"Processing command: {command_type}, ID: {command_id}")
-        
-        # 處理特殊命令
-        # Handle special commands
-        if command_type == "ping":
-            # 處理 ping 命令
-            # Handle ping command
-            timestamp = command_data.get("timestamp", time.time() * 1000)
-            response = {
-                "type": "pong",
-                "data": {
-                    "timestamp": timestamp,
-                    "server_time": time.time() * 1000
-                },
-                "id": command_id
-            }
-            
-            try:
-                await websocket.send(json.dumps(response))
-                self.logger.info("已發送 pong 響應")
-                self.logger.info("Sent pong response")
-            except Exception as e:
-                self.logger.error(f"發送 pong 響應時出錯: {e}")
-                self.logger.error(f"Error sending pong response: {e}")
-            
-            return
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("處理命令: %s, ID: %s", command_type, command_id)
+            self.logger.debug("Processing command: %s, ID: %s", command_type, command_id)
         
-        elif command_type == "get_status":
-            # 處理獲取狀態命令
-            # Handle get status command
-            await self._send_status(websocket)
-            return
+        handler = self._command_handlers.get(command_type, self._forward_command)
+        await handler(websocket, data, command_id)
+    
+    async def _cmd_ping(self, websocket, data, command_id):
+        """處理 ping 命令 (Handle ping command)"""
+        command_data = data.get("data", {})
+        timestamp = command_data.get("timestamp", _now_ms())
+        response = _PONG_TEMPLATE % (_dumps(timestamp), _dumps(_now_ms()), _dumps(command_id))
         
-        elif command_type == "start_video_stream":
-            # 處理開始視頻流命令
-            # Handle start video stream command
-            with self.lock:
-                self.video_clients.add(websocket)
-            
-            self.logger.info(f"客戶端已添加到視頻流列表，當前視頻客戶端數量: {len(self.video_clients)}")
-            self.logger.info(f"Client added to video stream list, current video clients: {len(self.video_clients)}")
-            
-            # 如果視頻流尚未啟動，則啟動它
-            # Start video streaming if not already started
-            if not self.video_streaming:
-                self.start_video_streaming()
-            
-            response = {
-                "type": "command_response",
-                "data": {
-                    "success": True,
-                    "message": "Video streaming started",
-                    "message_cht": "視頻流已啟動"
-                },
-                "id": command_id
-            }
-            
-            try:
-                await websocket.send(json.dumps(response))
-            except Exception as e:
-                self.logger.error(f"發送視頻流啟動響應時出錯: {e}")
-                self.logger.error(f"Error sending video stream start response: {e}")
-            
-            return
+        try:
+            await websocket.send(response)
+            self.logger.info("已發送 pong 響應")
+            self.logger.info("Sent pong response")
+        except Exception as e:
+            self.logger.error(f"發送 pong 響應時出錯: {e}")
+            self.logger.error(f"Error sending pong response: {e}")
+    
+    async def _cmd_get_status(self, websocket, data, command_id):
+        """處理獲取狀態命令 (Handle get status command)"""
+        await self._send_status(websocket)
+    
+    async def _cmd_start_video_stream(self, websocket, data, command_id):
+        """處理開始視頻流命令 (Handle start video stream command)"""
+        self.video_clients.add(websocket)
         
-        elif command_type == "stop_video_stream":
-            # 處理停止視頻流命令
-            # Handle stop video stream command
-            with self.lock:
-                self.video_clients.discard(websocket)
-            
-            self.logger.info(f"客戶端已從視頻流列表中移除，當前視頻客戶端數量: {len(self.video_clients)}")
-            self.logger.info(f"Client removed from video stream list, current video clients: {len(self.video_clients)}")
-            
-            # 如果沒有更多視頻客戶端，則停止視頻流
-            # Stop video streaming if no more video clients
-            if not self.video_clients and self.video_streaming:
-                self.stop_video_streaming()
-            
-            response = {
-                "type": "command_response",
-                "data": {
-                    "success": True,
-                    "message": "Video streaming stopped",
-                    "message_cht": "視頻流已停止"
-                },
-                "id": command_id
-            }
-            
-            try:
-                await websocket.send(json.dumps(response))
-            except Exception as e:
-                self.logger.error(f"發送視頻流停止響應時出錯: {e}")
-                self.logger.error(f"Error sending video stream stop response: {e}")
-            
-            return
+        self.logger.info(f"客戶端已添加到視頻流列表，當前視頻客戶端數量: {len(self.video_clients)}")
+        self.logger.info(f"Client added to video stream list, current video clients: {len(self.video_clients)}")
+        
+        # 如果視頻流尚未啟動，則啟動它
+        # Start video streaming if not already started
+        if not self.video_streaming:
+            self.start_video_streaming()
+        
+        response = _COMMAND_RESPONSE_TEMPLATE % (_VIDEO_STARTED_DATA, _dumps(command_id))
+        
+        try:
+            await websocket.send(response)
+        except Exception as e:
+            self.logger.error(f"發送視頻流啟動響應時出錯: {e}")
+            self.logger.error(f"Error sending video stream start response: {e}")
+    
+    async def _cmd_stop_video_stream(self, websocket, data, command_id):
+        """處理停止視頻流命令 (Handle stop video stream command)"""
+        self.video_clients.discard(websocket)
+        
+        self.logger.info(f"客戶端已從視頻流列表中移除，當前視頻客戶端數量: {len(self.video_clients)}")
+        self.logger.info(f"Client removed from video stream list, current video clients: {len(self.video_clients)}")
+        
+        # 如果沒有更多視頻客戶端，則停止視頻流
+        # Stop video streaming if no more video clients
+        if not self.video_clients and self.video_streaming:
+            self.stop_video_streaming()
+        
+        response = _COMMAND_RESPONSE_TEMPLATE % (_VIDEO_STOPPED_DATA, _dumps(command_id))
         
-        # 將命令轉發到機器人控制器
-        # Forward command to robot controller
+        try:
+            await websocket.send(response)
+        except Exception as e:
+            self.logger.error(f"發送視頻流停止響應時出錯: {e}")
+            self.logger.error(f"Error sending video stream stop response: {e}")
+    
+    async def _forward_command(self, websocket, data, command_id):
+        """將命令轉發到機器人控制器並發送其響應
+        Forward command to robot controller and send its response"""
         try:
             result = self.command_handler(data)
             
@@ -386,7 +442,7 @@ class WebSocketServer:
             
             # 發送響應
             # Send response
-            await websocket.send(json.dumps(result))
+            await websocket.send(_dumps(result))
         except Exception as e:
             self.logger.error(f"處理命令時出錯: {e}")
             self.logger.error(f"Error handling command: {e}")
@@ -403,7 +459,7 @@ class WebSocketServer:
             }
             
             try:
-                await websocket.send(json.dumps(error_response))
+                await websocket.send(_dumps(error_response))
             except Exception as send_error:
                 self.logger.error(f"發送錯誤響應時出錯: {send_error}")
                 self.logger.error(f"Error sending error response: {send_error}")
@@ -415,25 +471,61 @@ class WebSocketServer:
             websocket: WebSocket連接
         """
         try:
-            # 獲取狀態
-            # Get status
-            status = self.status_provider()
-            
-            # 構建狀態消息
-            # Build status message
-            status_message = {
-                "type": "status_update",
-                "data": status,
-                "id": f"status_{int(time.time() * 1000)}"
-            }
-            
-            # 發送狀態
-            # Send status
-            await websocket.send(json.dumps(status_message))
+            await websocket.send(self._current_status_json())
         except Exception as e:
             self.logger.error(f"發送狀態時出錯: {e}")
             self.logger.error(f"Error sending status: {e}")
     
+    def _status_message_json(self, status):
+        """構建狀態更新消息並序列化為JSON
+        Build a status update message and serialize it to JSON
+        
+        Args:
+            status (dict): 狀態數據 (Status data)
+            
+        Returns:
+            str: 狀態消息JSON (Status message JSON)
+        """
+        # 調試日誌，檢查人臉座標是否存在
+        # Debug log, check if face coordinates exist
+        if status:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("WebSocketServer.broadcast_status: 狀態数据包含客户端所需的人臉坐标数据: face_x=%s, face_y=%s",
+                                  status.get('face_x', 'missing'), status.get('face_y', 'missing'))
+                self.logger.debug("WebSocketServer.broadcast_status: Status data contains face coordinates needed by client: face_x=%s, face_y=%s",
+                                  status.get('face_x', 'missing'), status.get('face_y', 'missing'))
+            
+            # 確保人臉座標以浮點數格式傳送
+            # Ensure face coordinates are transmitted as float
+            if 'face_x' in status and status['face_x'] is not None:
+                status['face_x'] = float(status['face_x'])
+            if 'face_y' in status and status['face_y'] is not None:
+                status['face_y'] = float(status['face_y'])
+        
+        return _dumps({
+            "type": "status_update",
+            "data": status,
+            "id": f"status_{_now_ms()}"
+        })
+    
+    def _current_status_json(self):
+        """獲取當前狀態消息JSON，緩存有效期內重用上次結果
+        Get the current status message JSON, reusing the last one within the cache TTL
+        
+        Returns:
+            str: 狀態消息JSON (Status message JSON)
+        """
+        now = time.monotonic()
+        cached_at, message_json = self._status_cache
+        if message_json is not None and now - cached_at < self.status_cache_ttl:
+            return message_json
+        
+        message_json = self._status_message_json(self.status_provider())
+        # 以單個元組替換，其他線程不會讀到不一致的緩存
+        # Replaced as one tuple, so other threads never see a half-updated cache
+        self._status_cache = (now, message_json)
+        return message_json
+    
     def start_video_streaming(self):
         """啟動視頻流
         Start video streaming"""
@@ -495,126 +587,114 @@ class WebSocketServer:
             if status is not None and isinstance(status, dict) and "type" in status:
                 # 已經是完整的消息，直接使用
                 # Already a complete message, use directly
-                message = status
+                message_json = _dumps(status)
+            elif status is None:
+                # 獲取當前狀態，短時間內的重複廣播重用緩存
+                # Get current status, bursts of broadcasts reuse the cached message
+                message_json = self._current_status_json()
             else:
-                # 獲取狀態
-                # Get status
-                if status is None:
-                    status = self.status_provider()
-                
-                # 新增調試日誌，檢查人臉座標是否存在
-                # Add debug log, check if face coordinates exist
-                if status:
-                    self.logger.info(f"WebSocketServer.broadcast_status: 狀態数据包含客户端所需的人臉坐标数据: face_x={status.get('face_x', 'missing')}, face_y={status.get('face_y', 'missing')}")
-                    self.logger.info(f"WebSocketServer.broadcast_status: Status data contains face coordinates needed by client: face_x={status.get('face_x', 'missing')}, face_y={status.get('face_y', 'missing')}")
-                    
-                    # 確保人臉座標以浮點數格式傳送
-                    # Ensure face coordinates are transmitted as float
-                    if 'face_x' in status and status['face_x'] is not None:
-                        status['face_x'] = float(status['face_x'])
-                    if 'face_y' in status and status['face_y'] is not None:
-                        status['face_y'] = float(status['face_y'])
-            
-                # 構建狀態消息
-                # Build status message
-                message = {
-                    "type": "status_update",
-                    "data": status,
-                    "id": f"status_{int(time.time() * 1000)}"
-                }
-            
-            # 序列化為JSON
-            # Serialize to JSON
-            message_json = json.dumps(message)
+                message_json = self._status_message_json(status)
             
-            # 廣播到所有客戶端
-            # Broadcast to all clients
-            with self.lock:
-                clients = list(self.clients)
+            if self.loop is None:
+                return
             
-            # 創建新的事件循環
-            # Create new event loop
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+            # 在服務器事件循環上放入各客戶端的發送隊列，不等待發送完成；客戶端集合也在該循環上讀取
+            # Enqueue on the server event loop for each client, without waiting for the sends; the client set is read on that loop too
+            self.loop.call_soon_threadsafe(self._broadcast, message_json, self.clients)
             
-            # 廣播消息
-            # Broadcast message
-            loop.run_until_complete(self._broadcast(message_json, clients))
-            loop.close()
-            
-            self.logger.info(f"成功廣播消息到 {len(clients)} 個客戶端")
-            self.logger.info(f"Successfully broadcast message to {len(clients)} clients")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("成功廣播消息到 %d 個客戶端", len(self.clients))
+                self.logger.debug("Successfully broadcast message to %d clients", len(self.clients))
         except Exception as e:
             self.logger.error(f"廣播狀態時出錯: {e}")
             self.logger.error(f"Error broadcasting status: {e}")
     
-    async def _broadcast(self, message, clients):
-        """向所有客戶端廣播消息
-        Broadcast message to all clients
+    def _broadcast(self, message, clients):
+        """向所有客戶端廣播消息，必須在服務器事件循環中調用
+        Broadcast message to all clients, must be called on the server event loop
+        
+        同一個消息對象被放入所有客戶端的隊列，不會為每個客戶端複製
+        The same message object is queued for every client, it is never copied per client
         
         Args:
-            message (str): 要廣播的消息 (Message to broadcast)
-            clients (list): 客戶端列表 (Client list)
+            message (str or bytes): 要廣播的消息，文本消息或二進制視頻幀 (Message to broadcast, a text message or a binary video frame)
+            clients (set): 客戶端集合，在事件循環中同步遍歷 (Client set, iterated synchronously on the event loop)
         """
-        if not clients:
-            return
-        
-        # 創建所有發送任務
-        # Create all send tasks
-        send_tasks = []
         for client in clients:
-            if self._is_connection_closed(client):
+            queue = self.client_queues.get(client)
+            if queue is None:
                 continue
-            
-            # 創建發送任務
-            # Create send task
-            task = asyncio.ensure_future(self._send_to_client(client, message))
-            send_tasks.append(task)
-        
-        # 等待所有任務完成
-        # Wait for all tasks to complete
-        if send_tasks:
-            await asyncio.gather(*send_tasks, return_exceptions=True)
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # 慢速客戶端丟棄本條消息，不阻塞其他客戶端
+                # Slow client drops this message instead of stalling the others
+                self.client_drops[client] = self.client_drops.get(client, 0) + 1
+    
+    async def _writer_loop(self, client, queue):
+        """客戶端寫入任務，按順序發送其隊列中的消息
+        積壓時只發送最新的視頻幀，文本消息全部按順序發送
+        Client writer task, sends the messages in its queue in order
+        When backed up only the newest video frame is sent, text messages are all sent in order
+        
+        Args:
+            client: WebSocket客戶端
+            queue (asyncio.Queue): 客戶端的發送隊列 (The client's send queue)
+        """
+        while True:
+            messages = [await queue.get()]
+            if not queue.empty():
+                # 取出所有積壓的消息，丟棄被更新幀取代的視頻幀
+                # Drain the backlog and drop video frames superseded by a newer one
+                while not queue.empty():
+                    messages.append(queue.get_nowait())
+                newest_frame = next((m for m in reversed(messages) if isinstance(m, bytes)), None)
+                messages = [m for m in messages if not isinstance(m, bytes) or m is newest_frame]
+            if not await self._send_to_client(client, messages):
+                return
     
-    async def _send_to_client(self, client, message):
+    async def _send_to_client(self, client, messages):
         """發送消息到客戶端
-        Send message to client
+        Send messages to client
         
         Args:
             client: WebSocket客戶端
-            message (str): 要發送的消息
+            messages (list): 要按順序發送的消息 (Messages to send in order)
         """
-        try:
-            await client.send(message)
-            return True
-        except websockets.exceptions.ConnectionClosed:
-            # 連接已關閉，從客戶端集合中移除
-            # Connection closed, remove from client set
-            with self.lock:
+        for message in messages:
+            try:
+                await client.send(message)
+            except websockets.exceptions.ConnectionClosed:
+                # 連接已關閉，從客戶端集合中移除
+                # Connection closed, remove from client set
                 self.clients.discard(client)
                 self.video_clients.discard(client)
-            return False
-        except Exception as e:
-            self.logger.error(f"發送消息到客戶端時出錯: {e}")
-            self.logger.error(f"Error sending message to client: {e}")
-            return False
+                self.client_queues.pop(client, None)
+                return False
+            except Exception as e:
+                # 其他錯誤只丟棄本條消息，寫入任務繼續運行，避免隊列被填滿後消息全部被丟棄
+                # Other errors drop only this message and keep the writer running, so the queue never fills up for good
+                self.logger.error(f"發送消息到客戶端時出錯: {e}")
+                self.logger.error(f"Error sending message to client: {e}")
+        return True
     
     def _video_streaming_loop(self):
         """視頻流主循環
         Video streaming main loop"""
         import numpy as np
         import cv2
-        from datetime import datetime
         
         self.logger.info("啟動視頻流循環")
         self.logger.info("Starting video streaming loop")
+
+        # 編碼在其餘核心上運行，與事件循環分開
+        # Encoding runs on the remaining cores, away from the event loop
+        pin_current_thread(worker_cores(), self.logger)
         
         # 視頻流循環參數
         # Video streaming loop parameters
-        last_frame_time = 0
+        next_deadline = time.monotonic()  # 下一幀的發送截止時間 (Deadline for the next frame)
         frame_count = 0    # 幀計數器，用於動畫效果
-        error_count = 0    # 錯誤計數器
-        max_errors = 5     # 最大連續錯誤數
         
         # 使用 VisionSystem 的攝像頭
         # Use VisionSystem's camera
@@ -631,52 +711,77 @@ class WebSocketServer:
                 self.logger.warning("找不到視覺系統實例，將使用模擬視頻")
                 self.logger.warning("Could not find vision system instance, will use simulated video")
         except Exception as e:
-            self.logger.error(f"初始化攝像頭時出錯: {e}")
-            self.logger.error(f"Error initializing camera: {e}")
+            self.logger.error("初始化攝像頭時出錯: %s", e)
+            self.logger.error("Error initializing camera: %s", e)
             camera = None
         
+        # 選擇 JPEG 編碼器，libjpeg-turbo 不可用時回退到 cv2.imencode
+        # Select JPEG encoder, fall back to cv2.imencode if libjpeg-turbo is unavailable
+        turbo_jpeg = _TURBO_JPEG
+        if turbo_jpeg is not None:
+            self.logger.info("使用 libjpeg-turbo 進行 JPEG 編碼")
+            self.logger.info("Using libjpeg-turbo for JPEG encoding")
+        else:
+            self.logger.info("使用 cv2.imencode 進行 JPEG 編碼")
+            self.logger.info("Using cv2.imencode for JPEG encoding")
+
+        # 在循環外檢查一次日誌級別，熱路徑上不再構建調試消息
+        # Check the log level once outside the loop so the hot path never builds debug messages
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+
+        # 預先分配模擬幀緩衝區並提前構建 JPEG 參數，避免每幀重新分配
+        # Preallocate the simulated frame buffers and build the JPEG parameters once instead of per frame
+        sim_background = np.full((480, 640, 3), (30, 30, 50), dtype=np.uint8)  # 藍色背景 / Blue background
+        sim_frame = np.empty_like(sim_background)
+        encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), 70]
+        
         # 主視頻流循環
         # Main video streaming loop
         while self.video_streaming and self.running:
             try:
                 # 檢查是否有視頻客戶端
                 # Check if there are video clients
-                with self.lock:
-                    if not self.video_clients:
-                        time.sleep(0.1)
-                        continue
+                if not self.video_clients:
+                    time.sleep(0.1)
+                    continue
                 
-                # 獲取當前時間
-                # Get current time
-                current_time = time.time()
+                # 只休眠到下一幀的截止時間，發送耗時不會累加到幀間隔上
+                # Sleep only until the next frame deadline, so send time doesn't add to the frame interval
+                delay = next_deadline - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                next_deadline += self.video_interval
+                if next_deadline < time.monotonic():
+                    # 落後時重新對齊，而不是連續補發幀
+                    # Realign when behind instead of bursting to catch up
+                    next_deadline = time.monotonic()
                 
-                # 檢查是否應該發送新幀
-                # Check if should send new frame
-                if current_time - last_frame_time < self.video_interval:
-                    time.sleep(0.01)  # 短暫休眠以減少CPU使用率
-                    continue
+                # 獲取當前時間（毫秒）
+                # Get current time (milliseconds)
+                timestamp_ms = _now_ms()
                 
                 try:
-                    # 獲取當前時間戳
-                    current_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-                    
                     # 從 VisionSystem 獲取幀
                     # Get frame from VisionSystem
                     if self.vision_system is not None:
                         vision_frame = self.vision_system.get_latest_frame()
                         if vision_frame is not None:
-                            self.logger.debug("從 VisionSystem 獲取到幀")
-                            self.logger.debug("Got frame from VisionSystem")
+                            if debug_enabled:
+                                self.logger.debug("從 VisionSystem 獲取到幀")
+                                self.logger.debug("Got frame from VisionSystem")
                             frame = vision_frame
                             height, width = frame.shape[:2]
                         else:
-                            self.logger.warning("無法從 VisionSystem 獲取幀，將使用模擬視頻")
-                            self.logger.warning("Cannot get frame from VisionSystem, will use simulated video")
+                            # 每幀都可能觸發，降為 DEBUG 避免淹沒日誌
+                            # May fire on every frame, demoted to DEBUG so it doesn't flood the log
+                            if debug_enabled:
+                                self.logger.debug("無法從 VisionSystem 獲取幀，將使用模擬視頻")
+                                self.logger.debug("Cannot get frame from VisionSystem, will use simulated video")
                             # 創建一個模擬幀作為備用
                             # Create a simulated frame as fallback
-                            height, width = 480, 640
-                            frame = np.zeros((height, width, 3), dtype=np.uint8)
-                            frame[:, :] = (30, 30, 50)  # 藍色背景 / Blue background
+                            height, width = sim_frame.shape[:2]
+                            np.copyto(sim_frame, sim_background)
+                            frame = sim_frame
                             
                             # 添加動畫效果 / Add animation
                             center_x = int(width/2 + width/4 * np.sin(frame_count * 0.05))
@@ -690,9 +795,9 @@ class WebSocketServer:
                     else:
                         # 如果沒有 VisionSystem，創建一個模擬幀
                         # If no VisionSystem, create a simulated frame
-                        height, width = 480, 640
-                        frame = np.zeros((height, width, 3), dtype=np.uint8)
-                        frame[:, :] = (30, 30, 50)  # 藍色背景 / Blue background
+                        height, width = sim_frame.shape[:2]
+                        np.copyto(sim_frame, sim_background)
+                        frame = sim_frame
                         
                         # 添加動畫效果 / Add animation
                         center_x = int(width/2 + width/4 * np.sin(frame_count * 0.05))
@@ -700,16 +805,12 @@ class WebSocketServer:
                         cv2.circle(frame, (center_x, center_y), 30, (0, 165, 255), -1)
                     
                     # 增加幀計數器 / Increment frame counter
+                    # 標題和時間戳由前端根據幀元數據繪製
+                    # Title and timestamp are drawn by the frontend from the frame metadata
                     frame_count += 1
-                    
-                    # 添加文字 / Add text
-                    cv2.putText(frame, f'MaoMao Robot Camera', (20, 30), 
-                                cv2.FONT_HERSHEY_SIMPLEX, 0.7, (100, 200, 255), 1)
-                    cv2.putText(frame, f'Time: {current_timestamp}', (20, 60), 
-                                cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 1)
                 except Exception as e:
-                    self.logger.error(f"創建模擬幀時出錯: {e}")
-                    self.logger.error(f"Error creating simulated frame: {e}")
+                    self.logger.error("創建模擬幀時出錯: %s", e)
+                    self.logger.error("Error creating simulated frame: %s", e)
                     # 創建一個簡單的錯誤幀
                     height, width = 480, 640  # 確保在錯誤情況下也有定義 width 和 height
                     frame = np.zeros((height, width, 3), dtype=np.uint8)
@@ -720,84 +821,46 @@ class WebSocketServer:
                 # Ensure width and height are defined in all code paths
                 if 'width' not in locals() or 'height' not in locals():
                     height, width = frame.shape[:2]  # 從幀中提取尺寸
-                    self.logger.info(f"從幀中提取尺寸: {width}x{height}")
-                    self.logger.info(f"Extracted dimensions from frame: {width}x{height}")
+                    self.logger.info("從幀中提取尺寸: %dx%d", width, height)
+                    self.logger.info("Extracted dimensions from frame: %dx%d", width, height)
                 
                 # 降低JPEG品質以減少帶寬使用
                 # Lower JPEG quality to reduce bandwidth usage
-                encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), 70]
-                _, buffer = cv2.imencode('.jpg', frame, encode_param)
-                
-                # 將圖像編碼為base64
-                # Encode image to base64
-                jpg_as_text = base64.b64encode(buffer).decode('utf-8')
-                
-                # 構建視頻幀消息
-                # Build video frame message
-                video_message = {
-                    "type": "video_frame",
-                    "data": {
-                        "image": jpg_as_text,
-                        "timestamp": current_time,
-                        "width": width,
-                        "height": height
-                    }
-                }
+                if turbo_jpeg is not None:
+                    buffer = turbo_jpeg.encode(frame, quality=70, pixel_format=TJPF_BGR, jpeg_subsample=TJSAMP_420)
+                else:
+                    _, buffer = cv2.imencode('.jpg', frame, encode_param)
                 
-                # 序列化為JSON
-                # Serialize to JSON
-                message_json = json.dumps(video_message)
+                # 頭部和JPEG組成單個二進制幀，每幀只構建一次，所有客戶端共享
+                # Header and JPEG form a single binary frame, built once per frame and shared by every client
+                jpeg_bytes = buffer.tobytes() if hasattr(buffer, 'tobytes') else buffer
+                header = _FRAME_HEADER.pack(FRAME_MAGIC, FRAME_VERSION, 0, timestamp_ms,
+                                            width, height, len(jpeg_bytes))
+                payload = header + jpeg_bytes
                 
                 # 廣播到所有視頻客戶端
                 # Broadcast to all video clients
-                with self.lock:
-                    video_clients = list(self.video_clients)
-                
-                if video_clients:
+                if self.video_clients and self.loop is not None:
                     try:
-                        # 創建新的事件循環
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        
-                        # 實際發送消息
-                        loop.run_until_complete(self._broadcast(message_json, video_clients))
-                        loop.close()
-                        
-                        # 更新最後發送幀的時間
-                        last_frame_time = current_time
-                        error_count = 0  # 重置錯誤計數器
-                    except websockets.exceptions.ConnectionClosedOK as e:
-                        self.logger.info(f"在發送視頻幀期間連接關閉: {e}")
-                        self.logger.info(f"Connection closed during video frame send: {e}")
-                        # 不計入錯誤計數，這是正常的連接關閉
+                        # 放入各客戶端的發送隊列，由其寫入任務發送，不阻塞視頻線程；客戶端集合在服務器循環上讀取
+                        # Enqueue for each client's writer task without blocking the video thread; the client set is read on the server loop
+                        self.loop.call_soon_threadsafe(
+                            self._broadcast, payload, self.video_clients)
+                        # 已關閉的連接在發送失敗時由寫入任務移除
+                        # Closed connections are removed by their writer task when a send fails
                     except Exception as e:
-                        self.logger.error(f"發送視頻幀時出錯: {e}")
-                        self.logger.error(f"Error sending video frame: {e}")
-                        error_count += 1
-                        if error_count >= max_errors:
-                            self.logger.error(f"連續發生 {error_count} 個錯誤，重新檢查客戶端列表")
-                            self.logger.error(f"Consecutive {error_count} errors, rechecking client list")
-                            # 清理客戶端列表，移除已關閉的連接
-                            with self.lock:
-                                self.video_clients = {client for client in self.video_clients if not self._is_connection_closed(client)}
-                            error_count = 0  # 重置錯誤計數器
+                        self.logger.error("發送視頻幀時出錯: %s", e)
+                        self.logger.error("Error sending video frame: %s", e)
                         time.sleep(0.1)
                 else:
                     # 沒有客戶端或發送失敗
-                    self.logger.warning("沒有視頻客戶端或發送失敗")
-                    self.logger.warning("No video clients or sending failed")
+                    if debug_enabled:
+                        self.logger.debug("沒有視頻客戶端或發送失敗")
+                        self.logger.debug("No video clients or sending failed")
                     time.sleep(0.1)
             except Exception as e:
-                self.logger.error(f"視頻流循環中出錯: {e}")
-                self.logger.error(f"Error in video streaming loop: {e}")
-                error_count += 1
-                if error_count >= max_errors:
-                    self.logger.error(f"連續發生 {error_count} 個錯誤，重新檢查客戶端列表")
-                    self.logger.error(f"Consecutive {error_count} errors, rechecking client list")
-                    # 清理客戶端列表，移除已關閉的連接
-                    with self.lock:
-                        self.video_clients = {client for client in self.video_clients if not self._is_connection_closed(client)}
-                    error_count = 0  # 重置錯誤計數器
+                self.logger.error("視頻流循環中出錯: %s", e)
+                self.logger.error("Error in video streaming loop: %s", e)
                 time.sleep(0.5)  # 出錯時稍微長一點的休眠
         
         self.logger.info("視頻流循環已結束")
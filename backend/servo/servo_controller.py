@@ -141,6 +141,11 @@ class ServoController:
         # 初始化硬體連接
         self._init_hardware()
         
+        # 激光GPIO的sysfs值文件在首次切換時打開並緩存，避免在構造時運行sudo
+        # The laser GPIO sysfs value file is opened and cached on the first toggle, so construction never runs sudo
+        self._laser_fd = None
+        self._laser_gpio_initialized = False
+        
         self.logger.info("伺服馬達控制器初始化完成")
     
     def _init_hardware(self):
@@ -191,6 +196,73 @@ class ServoController:
         self.logger.info("模擬伺服馬達初始化完成")
         return False
         
+    def _init_laser_gpio(self):
+        """導出激光GPIO並緩存其sysfs值文件描述符，只在首次切換激光時嘗試一次
+        
+        Export the laser GPIO and cache a file descriptor for its sysfs value file,
+        attempted once on the first laser toggle
+        """
+        self._laser_gpio_initialized = True
+        if not IS_RASPBERRY_PI:
+            return
+            
+        GPIO_PIN = self.LASER_GPIO_PIN
+        value_path = f"/sys/class/gpio/gpio{GPIO_PIN}/value"
+        try:
+            import subprocess
+            
+            # sudo -n 不會等待密碼輸入，失敗時回退到每次調用的命令方式
+            # sudo -n never waits for a password, on failure the per-call command path is used instead
+            if not os.path.exists(value_path):
+                subprocess.check_call(["sudo", "-n", "sh", "-c", f"echo {GPIO_PIN} > /sys/class/gpio/export"])
+            subprocess.check_call(["sudo", "-n", "sh", "-c", f"echo out > /sys/class/gpio/gpio{GPIO_PIN}/direction"])
+            
+            self._laser_fd = os.open(value_path, os.O_WRONLY)
+            self.logger.info(f"已打開激光GPIO值文件: {value_path}")
+            self.logger.info(f"Opened laser GPIO value file: {value_path}")
+        except Exception as e:
+            self._laser_fd = None
+            self.logger.warning(f"無法打開激光GPIO值文件，將使用命令方式: {e}")
+            self.logger.warning(f"Cannot open laser GPIO value file, falling back to commands: {e}")
+    
+    def _write_laser_fd(self, value):
+        """通過緩存的文件描述符寫入激光GPIO值
+        
+        Write the laser GPIO value through the cached file descriptor
+        
+        Args:
+            value (bytes): b"1" 開啟，b"0" 關閉
+            
+        Returns:
+            bool: 寫入是否成功
+        """
+        if self._laser_fd is None and not self._laser_gpio_initialized:
+            self._init_laser_gpio()
+        if self._laser_fd is None:
+            return False
+            
+        try:
+            os.lseek(self._laser_fd, 0, os.SEEK_SET)
+            os.write(self._laser_fd, value)
+            return True
+        except OSError as e:
+            self.logger.error(f"寫入激光GPIO值文件失敗: {e}")
+            self.logger.error(f"Failed to write laser GPIO value file: {e}")
+            return False
+    
+    def close(self):
+        """釋放激光GPIO文件描述符
+        
+        Release the laser GPIO file descriptor
+        """
+        if self._laser_fd is not None:
+            try:
+                os.close(self._laser_fd)
+            except OSError as e:
+                self.logger.error(f"關閉激光GPIO值文件失敗: {e}")
+                self.logger.error(f"Failed to close laser GPIO value file: {e}")
+            self._laser_fd = None
+    
     def _set_all_pixels(self, color):
         """設置所有LED像素為相同顏色
         
@@ -250,6 +322,9 @@ class ServoController:
                 self.logger.error(f"GPIO清理失敗: {e}")
                 self.logger.error(f"GPIO cleanup failed: {e}")
         
+        # 釋放激光GPIO文件描述符
+        self.close()
+        
         self.logger.info("伺服馬達控制器已停止")
     
     def _update_loop(self):
@@ -718,6 +793,13 @@ class ServoController:
         self.logger.info("Activating laser module")
         self.laser_active = True
         
+        # 優先使用已緩存的sysfs文件描述符
+        # Prefer the cached sysfs file descriptor
+        if self._write_laser_fd(b"1"):
+            self.logger.info(f"激光模塊已啟動 (sysfs GPIO {self.LASER_GPIO_PIN})")
+            self.logger.info(f"Laser module activated (sysfs GPIO {self.LASER_GPIO_PIN})")
+            return True
+        
         # 嘗試使用pinctrl命令（適用於Pi 5）
         try:
             self.logger.info("嘗試使用pinctrl命令啟動激光器 (Pi 5)")
@@ -794,6 +876,13 @@ class ServoController:
         self.logger.info("Deactivating laser module")
         self.laser_active = False
         
+        # 優先使用已緩存的sysfs文件描述符
+        # Prefer the cached sysfs file descriptor
+        if self._write_laser_fd(b"0"):
+            self.logger.info(f"激光模塊已關閉 (sysfs GPIO {self.LASER_GPIO_PIN})")
+            self.logger.info(f"Laser module deactivated (sysfs GPIO {self.LASER_GPIO_PIN})")
+            return True
+        
         # 嘗試使用pinctrl命令（適用於Pi 5）
         try:
             self.logger.info("嘗試使用pinctrl命令關閉激光器 (Pi 5)")
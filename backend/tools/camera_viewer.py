@@ -12,7 +12,7 @@ import time
 import os
 import numpy as np
 import logging
-from datetime import datetime
+import threading
 
 # Add the parent directory to the path so we can import modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -20,6 +20,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from vision.vision_system import VisionSystem
 from utils.config_loader import ConfigLoader
 from utils.logger import setup_logger
+from utils.cpu_affinity import IO_CORES, pin_current_thread
 
 # Setup logging
 logger = setup_logger()
@@ -54,8 +55,37 @@ class CameraViewer:
         self.text_color = (0, 255, 0)  # Green
         self.text_color_alert = (0, 0, 255)  # Red
         
+        # Text baseline positions, computed once
+        # 文字基線位置，只計算一次
+        self._slot_ts = (10, 30)
+        self._slot_line1 = (10, 70)
+        self._slot_line2 = (10, 100)
+        self._slot_id = (10, 130)
+        
+        # Timestamp text cache, reformatted once per second
+        # 時間戳文字緩存，每秒只重新格式化一次
+        self._ts_second = None
+        self._ts_text = ""
+        
+        # Latest-wins frame slot, replaced by the vision thread whenever a fresh frame lands
+        # 最新幀槽位，每當有新幀時由視覺線程替換
+        self._frame_lock = threading.Lock()
+        self._latest_frame = None
+        self._frame_ready = threading.Event()
+        self.vision_system.add_frame_listener(self._on_new_frame)
+        
         self.running = False
     
+    def _on_new_frame(self, frame):
+        """Wake the display loop when the vision thread has a new frame
+        當視覺線程有新幀時喚醒顯示循環"""
+        # Copy now, the vision system reuses its frame buffers; the display loop draws on this copy
+        # 立即複製，視覺系統會重用其幀緩衝區；顯示循環在此副本上繪製
+        frame = frame.copy()
+        with self._frame_lock:
+            self._latest_frame = frame
+            self._frame_ready.set()
+    
     def start(self):
         """Start the camera viewer
         啟動攝像頭查看器"""
@@ -74,27 +104,37 @@ class CameraViewer:
         
         self.running = True
         
+        # Pin the display thread to core 0, the vision thread keeps its own affinity
+        # 將顯示線程固定到核心 0，視覺線程保持其原有親和性
+        pin_current_thread(IO_CORES, self.logger)
+        
         # Main loop
         try:
             while self.running:
-                # Get latest frame and data
-                frame = self.vision_system.get_latest_frame()
-                data = self.vision_system.get_latest_data()
-                
-                if frame is not None:
-                    # Draw recognition results on frame
-                    self._draw_recognition_results(frame, data)
+                # Wait for a new frame instead of polling
+                # 等待新幀而不是輪詢
+                if self._frame_ready.wait(timeout=0.05):
+                    self._frame_ready.clear()
                     
-                    # Show frame
-                    cv2.imshow(self.window_name, frame)
+                    # Take the newest frame, dropping any we did not get to
+                    # 取出最新幀，丟棄未來得及顯示的幀
+                    with self._frame_lock:
+                        frame = self._latest_frame
+                        self._latest_frame = None
                     
-                    # Check for key press (ESC to exit)
-                    key = cv2.waitKey(1) & 0xFF
-                    if key == 27:  # ESC key
-                        break
+                    if frame is not None:
+                        data = self.vision_system.get_latest_data()
+                        
+                        # Draw recognition results on frame
+                        self._draw_recognition_results(frame, data)
+                        
+                        # Show frame
+                        cv2.imshow(self.window_name, frame)
                 
-                # Sleep to reduce CPU usage
-                time.sleep(0.01)
+                # Check for key press (ESC to exit)
+                key = cv2.waitKey(1) & 0xFF
+                if key == 27:  # ESC key
+                    break
                 
         except KeyboardInterrupt:
             self.logger.info("Keyboard interrupt received, stopping...")
@@ -132,9 +172,18 @@ class CameraViewer:
             frame: 攝像頭畫面
             data (dict): 識別數據
         """
+        put_text = cv2.putText
+        font, font_scale, font_thickness = self.font, self.font_scale, self.font_thickness
+        text_color = self.text_color
+        
         # Draw timestamp
-        timestamp = datetime.fromtimestamp(data["timestamp"]).strftime("%Y-%m-%d %H:%M:%S")
-        cv2.putText(frame, timestamp, (10, 30), self.font, self.font_scale, self.text_color, self.font_thickness)
+        second = int(data["timestamp"])
+        if second != self._ts_second:
+            lt = time.localtime(second)
+            self._ts_text = "%04d-%02d-%02d %02d:%02d:%02d" % (
+                lt.tm_year, lt.tm_mon, lt.tm_mday, lt.tm_hour, lt.tm_min, lt.tm_sec)
+            self._ts_second = second
+        put_text(frame, self._ts_text, self._slot_ts, font, font_scale, text_color, font_thickness)
         
         # Draw face detection results
         if data["face_detected"]:
@@ -144,25 +193,21 @@ class CameraViewer:
             face_y = int(data["face_y"] * height)
             
             # Draw circle at face position
-            cv2.circle(frame, (face_x, face_y), 20, self.text_color, 2)
+            cv2.circle(frame, (face_x, face_y), 20, text_color, 2)
             
             # Draw recognized person
             if data["recognized_person"]:
-                text = f"Person: {data['recognized_person']}"
-                confidence = f"Confidence: {data['confidence']:.2f}"
-                cv2.putText(frame, text, (10, 70), self.font, self.font_scale, self.text_color, self.font_thickness)
-                cv2.putText(frame, confidence, (10, 100), self.font, self.font_scale, self.text_color, self.font_thickness)
+                put_text(frame, "Person: %s" % data["recognized_person"], self._slot_line1, font, font_scale, text_color, font_thickness)
+                put_text(frame, "Confidence: %.2f" % data["confidence"], self._slot_line2, font, font_scale, text_color, font_thickness)
             else:
-                text = "Unknown Person"
-                cv2.putText(frame, text, (10, 70), self.font, self.font_scale, self.text_color_alert, self.font_thickness)
+                put_text(frame, "Unknown Person", self._slot_line1, font, font_scale, self.text_color_alert, font_thickness)
             
             # Draw student ID detection
             if data["student_id_detected"]:
-                text = f"Student ID: {data['recognized_person']}"
-                cv2.putText(frame, text, (10, 130), self.font, self.font_scale, self.text_color, self.font_thickness)
+                put_text(frame, "Student ID: %s" % data["recognized_person"], self._slot_id, font, font_scale, text_color, font_thickness)
         else:
             # No face detected
-            cv2.putText(frame, "No face detected", (10, 70), self.font, self.font_scale, self.text_color, self.font_thickness)
+            put_text(frame, "No face detected", self._slot_line1, font, font_scale, text_color, font_thickness)
 
 def main():
     """Main function
@@ -191,18 +236,29 @@ def main():
     labels_path = os.path.join(model_dir, "labels.txt")
     test_labels_path = os.path.join(model_dir, "test_labels.txt")
     
-    # Backup original labels.txt if it exists and we haven't backed it up yet
-    backup_path = os.path.join(model_dir, "labels.txt.backup")
-    if os.path.exists(labels_path) and not os.path.exists(backup_path):
-        logger.info(f"Backing up original labels file to: {backup_path}")
-        logger.info(f"備份原始標籤文件到: {backup_path}")
-        shutil.copy2(labels_path, backup_path)
-    
-    # Copy test_labels.txt to labels.txt
+    # Link test_labels.txt to labels.txt, only relinking metadata instead of copying bytes
     if os.path.exists(test_labels_path):
-        logger.info(f"Copying test labels from {test_labels_path} to {labels_path}")
-        logger.info(f"從 {test_labels_path} 複製測試標籤到 {labels_path}")
-        shutil.copy2(test_labels_path, labels_path)
+        # Move the original labels.txt aside if we haven't backed it up yet
+        backup_path = os.path.join(model_dir, "labels.txt.backup")
+        if os.path.exists(labels_path) and not os.path.islink(labels_path) and not os.path.exists(backup_path):
+            logger.info(f"Backing up original labels file to: {backup_path}")
+            logger.info(f"備份原始標籤文件到: {backup_path}")
+            os.replace(labels_path, backup_path)
+        
+        logger.info(f"Linking test labels from {test_labels_path} to {labels_path}")
+        logger.info(f"從 {test_labels_path} 鏈接測試標籤到 {labels_path}")
+        tmp_path = labels_path + ".tmp"
+        try:
+            if os.path.lexists(tmp_path):
+                os.remove(tmp_path)
+            os.symlink(os.path.basename(test_labels_path), tmp_path)
+            os.replace(tmp_path, labels_path)
+        except OSError as e:
+            # Filesystems without symlink support (e.g. FAT)
+            # 不支持符號鏈接的文件系統（例如 FAT）
+            logger.warning(f"Cannot create symlink ({e}), copying test labels instead")
+            logger.warning(f"無法創建符號鏈接（{e}），改為複製測試標籤")
+            shutil.copy2(test_labels_path, labels_path)
     else:
         logger.warning(f"Test labels file not found: {test_labels_path}")
         logger.warning(f"找不到測試標籤文件: {test_labels_path}")
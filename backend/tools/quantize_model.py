@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Model Quantizer - Convert a Teachable Machine Keras model to a full-integer TFLite model
+模型量化工具 - 將 Teachable Machine Keras 模型轉換為全整數 TFLite 模型
+
+The resulting model takes uint8 input, so VisionSystem feeds camera pixels without normalization.
+生成的模型使用 uint8 輸入，VisionSystem 可直接輸入攝像頭像素而無需歸一化。
+
+Usage / 用法:
+    python tools/quantize_model.py keras_model.h5 calibration_images/ models/teachable_machine_model.tflite
+"""
+
+import os
+import sys
+import argparse
+
+import cv2
+import numpy as np
+import tensorflow as tf
+
+
+def representative_dataset(image_dir, size, limit=200):
+    """Yield calibration samples preprocessed the same way as TFLiteModel.predict
+
+    Args:
+        image_dir (str): Directory of calibration images
+        size (tuple): Model input size (height, width)
+        limit (int): Maximum number of images to use
+
+    以與 TFLiteModel.predict 相同的方式預處理並產生校準樣本
+
+    Args:
+        image_dir (str): 校準圖像目錄
+        size (tuple): 模型輸入尺寸（高，寬）
+        limit (int): 使用的最大圖像數量
+    """
+    names = sorted(n for n in os.listdir(image_dir) if n.lower().endswith((".jpg", ".jpeg", ".png")))
+    for name in names[:limit]:
+        image = cv2.imread(os.path.join(image_dir, name))
+        if image is None:
+            continue
+        image = cv2.resize(image, (size[1], size[0]), interpolation=cv2.INTER_AREA)
+        yield [np.expand_dims(image.astype(np.float32) / 255.0, axis=0)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Quantize a Keras model to int8 TFLite / 將 Keras 模型量化為 int8 TFLite")
+    parser.add_argument("keras_model", help="Keras .h5 model exported from Teachable Machine")
+    parser.add_argument("image_dir", help="Directory of calibration images / 校準圖像目錄")
+    parser.add_argument("output", help="Output .tflite path / 輸出 .tflite 路徑")
+    args = parser.parse_args()
+
+    print(f"Loading Keras model from {args.keras_model}...")
+    print(f"從 {args.keras_model} 載入 Keras 模型...")
+    model = tf.keras.models.load_model(args.keras_model, compile=False)
+    size = tuple(model.input_shape[1:3])
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.representative_dataset = lambda: representative_dataset(args.image_dir, size)
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    converter.inference_input_type = tf.uint8
+    converter.inference_output_type = tf.uint8
+
+    print("Converting to int8 TFLite format...")
+    print("正在轉換為 int8 TFLite 格式...")
+    tflite_model = converter.convert()
+
+    with open(args.output, "wb") as f:
+        f.write(tflite_model)
+
+    print(f"Done, wrote {args.output}")
+    print(f"轉換完成，已產生 {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -93,8 +93,13 @@ class ConfigLoader:
                 "camera_index": 0,
                 "frame_width": 640,
                 "frame_height": 480,
+                "camera_fourcc": "MJPG",
                 "model_path": "models/teachable_machine_model.tflite",
-                "confidence_threshold": 0.7
+                "face_detector_model": "models/face_detection_yunet_2023mar.onnx",
+                "confidence_threshold": 0.7,
+                "id_confidence_threshold": 0.7,
+                "opencv_threads": 2,
+                "model_threads": 3
             },
             "servo": {
                 "eye_blink_interval": [2.0, 5.0],
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+CPU 親和性 - 將網絡IO線程與圖像處理線程分配到不同核心
+CPU Affinity - Keep network IO and image processing threads on separate cores
+"""
+
+import os
+import logging
+
+# 網絡/事件循環線程使用的核心
+# Core reserved for the network / event loop threads
+IO_CORES = {0}
+
+# 導入時（主線程）記錄進程的核心集合；新線程會繼承創建者的親和性，不能在固定後的線程中查詢
+# Process-wide core set, captured at import on the main thread; new threads inherit their
+# creator's affinity, so it cannot be queried from a thread that has already been pinned
+try:
+    _PROCESS_CORES = frozenset(os.sched_getaffinity(0))
+except AttributeError:
+    _PROCESS_CORES = frozenset(range(os.cpu_count() or 1))
+
+
+def worker_cores():
+    """獲取圖像處理線程可用的核心（除 IO 核心外的所有核心）
+    Get the cores available to image processing threads (every core except the IO core)
+
+    Returns:
+        set: 核心編號集合，單核系統上返回所有核心
+             Set of core ids, all cores on a single-core system
+    """
+    available = set(_PROCESS_CORES)
+    cores = available - IO_CORES
+    return cores or available
+
+
+def pin_current_thread(cores, logger=None):
+    """將當前線程固定到指定核心（僅 Linux，其他平台忽略）
+    Pin the calling thread to the given cores (Linux only, ignored elsewhere)
+
+    Args:
+        cores (set): 核心編號集合 / Set of core ids
+        logger (logging.Logger, optional): 日誌記錄器 / Logger
+
+    Returns:
+        bool: 是否成功設置 / Whether the affinity was applied
+    """
+    logger = logger or logging.getLogger("CpuAffinity")
+    try:
+        os.sched_setaffinity(0, cores)
+        return True
+    except (AttributeError, OSError) as e:
+        logger.debug("CPU affinity not set: %s", e)
+        return False
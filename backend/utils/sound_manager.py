@@ -40,11 +40,24 @@ class SoundManager:
             "angry": "robot-bass.wav"             # For shutdown/angry event
         }
         
-        # Verify sounds exist
+        # Verify sounds exist with a single directory listing
+        try:
+            with os.scandir(self.sound_dir) as entries:
+                present = {entry.name for entry in entries if entry.is_file()}
+        except OSError as e:
+            self.logger.warning(f"Cannot read sound directory {self.sound_dir}: {e}")
+            present = set()
+        
         for sound_type, filename in self.sounds.items():
-            sound_path = self.sound_dir / filename
-            if not sound_path.exists():
-                self.logger.warning(f"Sound file not found: {sound_path}")
+            if filename not in present:
+                self.logger.warning(f"Sound file not found: {self.sound_dir / filename}")
+        
+        # Absolute paths of the sounds that are available
+        self._abs = {
+            sound_type: str(self.sound_dir / filename)
+            for sound_type, filename in self.sounds.items()
+            if filename in present
+        }
     
     def play_sound(self, sound_type):
         """
@@ -61,10 +74,10 @@ class SoundManager:
             return False
             
         filename = self.sounds[sound_type]
-        sound_path = self.sound_dir / filename
+        sound_path = self._abs.get(sound_type)
         
-        if not sound_path.exists():
-            self.logger.warning(f"Sound file not found: {sound_path}")
+        if sound_path is None:
+            self.logger.warning(f"Sound file not found: {self.sound_dir / filename}")
             return False
             
         try:
@@ -72,9 +85,9 @@ class SoundManager:
             # Use afplay on macOS, aplay on Linux
             if os.name == 'posix':
                 if os.uname().sysname == 'Darwin':  # macOS
-                    subprocess.Popen(['afplay', str(sound_path)])
+                    subprocess.Popen(['afplay', sound_path])
                 else:  # Linux
-                    subprocess.Popen(['aplay', '-q', str(sound_path)])
+                    subprocess.Popen(['aplay', '-q', sound_path])
             else:
                 self.logger.warning("Sound playback not supported on this platform")
                 return False
@@ -9,11 +9,20 @@ Vision System - Process camera input and AI recognition
 import logging
 import threading
 import time
-import cv2
-import numpy as np
 import os
 import platform
-from datetime import datetime
+from enum import Enum, auto
+from dataclasses import dataclass
+from typing import Optional
+
+# Stop OpenMP worker threads from spin-waiting next to the TFLite and OpenCV pools; must be set before cv2 loads
+# 避免 OpenMP 工作線程在 TFLite 和 OpenCV 線程池旁自旋等待；必須在載入 cv2 之前設置
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
+import cv2
+import numpy as np
+
+from utils.cpu_affinity import worker_cores, pin_current_thread
 
 # Real TensorFlow Lite import for actual deployment
 # 實際部署時使用真實的 TensorFlow Lite
@@ -22,20 +31,112 @@ from datetime import datetime
 # 嘗試導入 TensorFlow Lite，如果不可用則回退到模擬
 
 try:
-    # Try to import TensorFlow Lite
-    import tensorflow as tf
-    print("Successfully imported TensorFlow version:", tf.__version__)
+    # Prefer the standalone runtime, it avoids loading the full TensorFlow package
+    # 優先使用獨立運行時，避免載入完整的 TensorFlow 套件
+    from tflite_runtime.interpreter import Interpreter
+    print("Successfully imported tflite_runtime")
     HAVE_TENSORFLOW = True
-except ImportError as e:
-    print(f"Failed to import TensorFlow: {e}")
-    HAVE_TENSORFLOW = False
+except ImportError:
+    try:
+        # Try to import TensorFlow Lite
+        import tensorflow as tf
+        Interpreter = tf.lite.Interpreter
+        print("Successfully imported TensorFlow version:", tf.__version__)
+        HAVE_TENSORFLOW = True
+    except ImportError as e:
+        print(f"Failed to import TensorFlow: {e}")
+        HAVE_TENSORFLOW = False
+    
+# Haar cascade shared by all VisionSystem instances, parsed on first use
+# 所有 VisionSystem 實例共享的 Haar 級聯分類器，首次使用時解析
+_FACE_CASCADE = None
+
+def _get_face_cascade():
+    """Get the shared Haar face cascade, loading it on first call
+獲取共享的 Haar 人臉級聯分類器，首次調用時載入"""
+    global _FACE_CASCADE
+    if _FACE_CASCADE is None:
+        _FACE_CASCADE = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+    return _FACE_CASCADE
+
+@dataclass
+class VisionData:
+    """Latest vision analysis result, slotted to keep per-pass allocations small
+最新的視覺分析結果，使用 __slots__ 以減少每次分析的內存分配"""
+    __slots__ = ("timestamp", "face_detected", "face_x", "face_y",
+                 "recognized_person", "student_id_detected", "confidence")
+    
+    timestamp: float
+    face_detected: bool
+    face_x: float  # 歸一化座標 (0-1)
+    face_y: float  # 歸一化座標 (0-1)
+    recognized_person: Optional[str]
+    student_id_detected: bool
+    confidence: float
+    
+    def to_dict(self):
+        """Convert to the dict format used by callers
+        轉換為調用方使用的字典格式"""
+        return {
+            "timestamp": self.timestamp,
+            "face_detected": self.face_detected,
+            "face_x": self.face_x,
+            "face_y": self.face_y,
+            "recognized_person": self.recognized_person,
+            "student_id_detected": self.student_id_detected,
+            "confidence": self.confidence
+        }
+
+class LabelKind(Enum):
+    """Meaning of a model label
+標籤的含義"""
+    UNKNOWN = auto()     # 未知人員（包括 Jeffrey）(Unknown person, including Jeffrey)
+    KNOWN_FACE = auto()  # Sonia 的臉 (Sonia's face)
+    KNOWN_ID = auto()    # Sonia 的學生證 (Sonia's student ID)
+    OTHER_ID = auto()    # 其他人的學生證 (Someone else's student ID)
+
+def _classify_label(class_name):
+    """Resolve a label name to its LabelKind, only Sonia is a known person
     
+    Args:
+        class_name (str): Label name from labels.txt
+        
+    Returns:
+        LabelKind: Kind of the label
+        
+    將標籤名稱解析為 LabelKind，只有 Sonia 是已知人員
+    
+    Args:
+        class_name (str): labels.txt 中的標籤名稱
+        
+    Returns:
+        LabelKind: 標籤類型
+    """
+    name = class_name.lower()
+    is_id = "id" in name or "card" in name
+    if "sonia" in name:
+        return LabelKind.KNOWN_ID if is_id else LabelKind.KNOWN_FACE
+    return LabelKind.OTHER_ID if is_id else LabelKind.UNKNOWN
+
 class TFLiteModel:
     """Real TensorFlow Lite model class with fallback to simulation
 真實的 TensorFlow Lite 模型類，帶有回退到模擬的功能"""
     
-    def __init__(self, model_path):
+    def __init__(self, model_path, num_threads=None):
+        """Load the model
+        
+        Args:
+            model_path (str): Path to the .tflite model
+            num_threads (int, optional): Interpreter threads, defaults to the image processing cores
+            
+        載入模型
+        
+        Args:
+            model_path (str): .tflite 模型路徑
+            num_threads (int, optional): 解釋器線程數，默認為圖像處理核心數
+        """
         self.model_path = model_path
+        self.num_threads = num_threads or len(worker_cores())
         self.logger = logging.getLogger("TFLiteModel")
         self.logger.info(f"載入模型: {model_path}")
         self.interpreter = None
@@ -47,12 +148,49 @@ class TFLiteModel:
             try:
                 self.logger.info("Using real TensorFlow Lite model")
                 self.logger.info("使用真實的 TensorFlow Lite 模型")
-                self.interpreter = tf.lite.Interpreter(model_path=model_path)
+                # Multi-threaded kernels; recent runtimes apply the XNNPACK delegate to float models by default
+                # 多線程內核；較新的運行時默認對浮點模型啟用 XNNPACK 委託
+                self.interpreter = Interpreter(model_path=model_path, num_threads=self.num_threads)
                 self.interpreter.allocate_tensors()
                 self.input_details = self.interpreter.get_input_details()
                 self.output_details = self.interpreter.get_output_details()
-                self.logger.info(f"Model loaded successfully. Input shape: {self.input_details[0]['shape']}")
-                self.logger.info(f"模型載入成功。輸入形狀: {self.input_details[0]['shape']}")
+                
+                # Cache input geometry and a resize scratch buffer so predict() doesn't allocate per call
+                # 緩存輸入尺寸和縮放緩衝區，predict() 無需每次分配內存
+                self._input_index = self.input_details[0]['index']
+                self._output_index = self.output_details[0]['index']
+                self._in_h, self._in_w = self.input_details[0]['shape'][1:3]
+                self._resized = np.empty((self._in_h, self._in_w, 3), dtype=np.uint8)
+                self._batch_size = self.input_details[0]['shape'][0]
+                
+                # Quantized outputs are dequantized after invoke
+                # 量化輸出在推理後反量化
+                self._out_scale, self._out_zero = self.output_details[0]['quantization']
+                self._quantized_output = self.output_details[0]['dtype'] != np.float32 and self._out_scale > 0
+                
+                # Integer inputs are quantized through a 256-entry lookup table built from the tensor's scale/zero_point;
+                # a uint8 input with scale 1/255 and zero point 0 (as produced by tools/quantize_model.py) takes the raw pixels
+                # 整數輸入通過查找表量化，查找表由張量的 scale/zero_point 構建；
+                # scale 為 1/255、zero point 為 0 的 uint8 輸入（tools/quantize_model.py 的輸出）直接使用原始像素
+                self._uint8_input = False
+                self._input_lut = None
+                input_dtype = self.input_details[0]['dtype']
+                if input_dtype in (np.uint8, np.int8):
+                    in_scale, in_zero = self.input_details[0]['quantization']
+                    if in_scale <= 0:
+                        raise ValueError(f"{np.dtype(input_dtype).name} model input has no quantization parameters")
+                    if input_dtype == np.uint8 and in_zero == 0 and np.isclose(in_scale, 1.0 / 255.0):
+                        self._uint8_input = True
+                        self.logger.info("Quantized uint8 model, skipping input normalization")
+                        self.logger.info("量化 uint8 模型，跳過輸入歸一化")
+                    else:
+                        info = np.iinfo(input_dtype)
+                        levels = np.arange(256, dtype=np.float32) / 255.0 / in_scale + in_zero
+                        self._input_lut = np.clip(np.round(levels), info.min, info.max).astype(input_dtype)
+                        self.logger.info(f"Quantized {np.dtype(input_dtype).name} model, input scale: {in_scale}, zero point: {in_zero}")
+                        self.logger.info(f"量化 {np.dtype(input_dtype).name} 模型，輸入 scale: {in_scale}，zero point: {in_zero}")
+                self.logger.info(f"Model loaded successfully. Input shape: {self.input_details[0]['shape']}, threads: {self.num_threads}")
+                self.logger.info(f"模型載入成功。輸入形狀: {self.input_details[0]['shape']}，線程數: {self.num_threads}")
             except Exception as e:
                 self.logger.error(f"Error loading TensorFlow Lite model: {e}")
                 self.logger.error(f"載入 TensorFlow Lite 模型時出錯: {e}")
@@ -78,42 +216,61 @@ class TFLiteModel:
         Returns:
             list: 各類別的預測概率
         """
+        return self.predict_batch([image])[0]
+    
+    def predict_batch(self, images):
+        """Run model prediction on several images with a single invoke()
+        
+        Args:
+            images (list): Input images (numpy arrays)
+            
+        Returns:
+            list: Prediction probabilities for each image
+            
+        以一次 invoke() 對多張圖像進行模型預測
+        
+        Args:
+            images (list): 輸入圖像（numpy 數組）
+            
+        Returns:
+            list: 每張圖像的預測概率
+        """
         # For debugging
-        self.logger.info(f"Image shape: {image.shape}")
+        self.logger.debug("Batch of %d, first image shape: %s", len(images), images[0].shape)
         
         # If we have a real TensorFlow Lite model, use it
         if self.interpreter is not None:
             try:
-                # Preprocess the image to match the model's input shape
-                input_shape = self.input_details[0]['shape'][1:3]  # Height, width
-                
-                # Check if we need to resize the image
-                if input_shape[0] != image.shape[0] or input_shape[1] != image.shape[1]:
-                    self.logger.info(f"Resizing image from {image.shape[:2]} to {input_shape}")
-                    image = cv2.resize(image, (input_shape[1], input_shape[0]))
-                
-                # Normalize the image (0-1 range)
-                processed_image = image.astype(np.float32) / 255.0
+                # Resize the input tensor only when the batch size changes
+                # 僅在批量大小改變時調整輸入張量
+                batch_size = len(images)
+                if batch_size != self._batch_size:
+                    self.interpreter.resize_tensor_input(self._input_index, [batch_size, self._in_h, self._in_w, 3])
+                    self.interpreter.allocate_tensors()
+                    self._batch_size = batch_size
                 
-                # Add batch dimension
-                input_data = np.expand_dims(processed_image, axis=0)
-                
-                # Set the input tensor
-                self.interpreter.set_tensor(self.input_details[0]['index'], input_data)
+                input_tensor = self.interpreter.tensor(self._input_index)()
+                for i, image in enumerate(images):
+                    self._write_input(input_tensor[i], image)
+                # The view must be released before invoke()
+                # 調用 invoke() 之前必須釋放該視圖
+                del input_tensor
                 
                 # Run inference
-                self.logger.info("Running model inference...")
+                self.logger.debug("Running model inference...")
                 self.interpreter.invoke()
                 
                 # Get the output tensor
-                output_data = self.interpreter.get_tensor(self.output_details[0]['index'])
+                output_data = self.interpreter.get_tensor(self._output_index)
                 
                 # Get probabilities
-                probabilities = output_data[0]
+                probabilities = output_data[:batch_size]
+                if self._quantized_output:
+                    probabilities = (probabilities.astype(np.float32) - self._out_zero) * self._out_scale
                 
                 # Log the shape and values of the output
-                self.logger.info(f"Output shape: {output_data.shape}")
-                self.logger.info(f"Real model prediction: {probabilities}")
+                self.logger.debug("Output shape: %s", output_data.shape)
+                self.logger.debug("Real model prediction: %s", probabilities)
                 
                 # Return the probabilities
                 return probabilities
@@ -123,10 +280,47 @@ class TFLiteModel:
                 # Fall back to simulation
         
         # Fallback: Simulation mode
-        self.logger.warning("Using simulation mode for prediction")
-        self.logger.warning("使用模擬模式進行預測")
+        self.logger.debug("Using simulation mode for prediction")
+        self.logger.debug("使用模擬模式進行預測")
+        
+        return [self._simulate_prediction(image) for image in images]
+    
+    def _write_input(self, dst, image):
+        """Preprocess an image straight into one slot of the input tensor
+        
+        Args:
+            dst: Input tensor slot (view)
+            image: Input image (numpy array)
+            
+        將圖像預處理後直接寫入輸入張量的一個位置
+        
+        Args:
+            dst: 輸入張量位置（視圖）
+            image: 輸入圖像（numpy 數組）
+        """
+        # Resize into the scratch buffer only if the image doesn't already match the model input
+        # 僅在圖像尺寸與模型輸入不符時縮放到緩衝區
+        if image.shape[0] != self._in_h or image.shape[1] != self._in_w:
+            self.logger.debug("Resizing image from %s to %s", image.shape[:2], (self._in_h, self._in_w))
+            # INTER_AREA when shrinking (faster, anti-aliased), INTER_LINEAR when enlarging
+            # 縮小時使用 INTER_AREA（更快且抗鋸齒），放大時使用 INTER_LINEAR
+            shrinking = image.shape[0] > self._in_h or image.shape[1] > self._in_w
+            interpolation = cv2.INTER_AREA if shrinking else cv2.INTER_LINEAR
+            image = cv2.resize(image, (self._in_w, self._in_h), dst=self._resized, interpolation=interpolation)
         
-        return self._simulate_prediction(image)
+        if self._uint8_input:
+            # Quantized model: copy the uint8 pixels verbatim
+            # 量化模型：直接複製 uint8 像素
+            np.copyto(dst, image)
+        elif self._input_lut is not None:
+            # Other quantized models: map each pixel through the lookup table
+            # 其他量化模型：每個像素通過查找表映射
+            np.take(self._input_lut, image, out=dst)
+        else:
+            # Normalize (0-1 range) straight into the interpreter's input tensor in one pass,
+            # no intermediate float copy and no set_tensor copy
+            # 一次性將歸一化結果（0-1 範圍）直接寫入解釋器的輸入張量，無需中間浮點副本和 set_tensor 複製
+            np.multiply(image, np.float32(1.0 / 255.0), out=dst, casting='unsafe')
     
     def _simulate_prediction(self, image):
         """Simulate model prediction based on image characteristics
@@ -147,33 +341,34 @@ class TFLiteModel:
         """
         height, width, _ = image.shape
         
-        # Divide the image into regions
-        # 將圖像分為區域
-        left_region = image[0:height, 0:width//3]
-        middle_region = image[0:height, width//3:2*width//3]
-        right_region = image[0:height, 2*width//3:width]
+        # Per-column channel sums and sums of squares in one pass over the image
+        # 一次遍歷圖像，計算每列各通道的和與平方和
+        pixels = image.astype(np.float64)
+        col_sum = pixels.sum(axis=0)
+        col_sq_sum = np.einsum('hwc,hwc->wc', pixels, pixels)
+        
+        # Fold the columns into the left / middle / right regions
+        # 將各列合併為左 / 中 / 右三個區域
+        bounds = [0, width//3, 2*width//3]
+        counts = height * np.diff(bounds + [width]).reshape(3, 1)
+        region_mean = np.add.reduceat(col_sum, bounds, axis=0) / counts
+        region_var = np.add.reduceat(col_sq_sum, bounds, axis=0) / counts - region_mean ** 2
         
         # Calculate average color in each region
         # 計算每個區域的平均顏色
-        left_avg = np.mean(left_region, axis=(0,1))
-        middle_avg = np.mean(middle_region, axis=(0,1))
-        right_avg = np.mean(right_region, axis=(0,1))
+        left_avg, middle_avg, right_avg = region_mean
         
-        # Calculate average brightness in each region
-        # 計算每個區域的平均亮度
-        left_brightness = np.mean(cv2.cvtColor(left_region, cv2.COLOR_BGR2GRAY))
-        middle_brightness = np.mean(cv2.cvtColor(middle_region, cv2.COLOR_BGR2GRAY))
-        right_brightness = np.mean(cv2.cvtColor(right_region, cv2.COLOR_BGR2GRAY))
+        # Calculate average brightness in each region (BGR to gray weights)
+        # 計算每個區域的平均亮度（BGR 轉灰度權重）
+        left_brightness, middle_brightness, right_brightness = region_mean @ np.array([0.114, 0.587, 0.299])
         
-        self.logger.info(f"Brightness - Left: {left_brightness:.2f}, Middle: {middle_brightness:.2f}, Right: {right_brightness:.2f}")
+        self.logger.debug("Brightness - Left: %.2f, Middle: %.2f, Right: %.2f", left_brightness, middle_brightness, right_brightness)
         
         # Calculate color variance in each region
         # 計算每個區域的顏色方差
-        left_variance = np.var(left_region, axis=(0,1)).sum()
-        middle_variance = np.var(middle_region, axis=(0,1)).sum()
-        right_variance = np.var(right_region, axis=(0,1)).sum()
+        left_variance, middle_variance, right_variance = region_var.sum(axis=1)
         
-        self.logger.info(f"Color variance - Left: {left_variance:.2f}, Middle: {middle_variance:.2f}, Right: {right_variance:.2f}")
+        self.logger.debug("Color variance - Left: %.2f, Middle: %.2f, Right: %.2f", left_variance, middle_variance, right_variance)
         
         # 模擬更接近真實模型的預測結果
         # 檢測人臉特徵
@@ -200,24 +395,24 @@ class TFLiteModel:
         # 根據特徵調整分數
         if face_features["jeffrey"]["blue_dominant"]:
             jeffrey_score += 0.3
-            self.logger.info("Jeffrey feature: Blue dominant")
+            self.logger.debug("Jeffrey feature: Blue dominant")
         if face_features["jeffrey"]["variance_high"]:
             jeffrey_score += 0.2
-            self.logger.info("Jeffrey feature: High variance")
+            self.logger.debug("Jeffrey feature: High variance")
             
         if face_features["sonia"]["green_dominant"]:
             sonia_score += 0.3
-            self.logger.info("Sonia feature: Green dominant")
+            self.logger.debug("Sonia feature: Green dominant")
         if face_features["sonia"]["brightness_medium"]:
             sonia_score += 0.2
-            self.logger.info("Sonia feature: Medium brightness")
+            self.logger.debug("Sonia feature: Medium brightness")
             
         if face_features["id_card"]["brightness_high"]:
             id_score += 0.4
-            self.logger.info("ID card feature: High brightness")
+            self.logger.debug("ID card feature: High brightness")
         if face_features["id_card"]["brightness_diff"]:
             id_score += 0.3
-            self.logger.info("ID card feature: Brightness difference")
+            self.logger.debug("ID card feature: Brightness difference")
         
         # 正規化分數為概率
         total = jeffrey_score + sonia_score + id_score
@@ -229,7 +424,7 @@ class TFLiteModel:
         predictions = [jeffrey_prob, sonia_prob, id_prob]
         max_idx = np.argmax(predictions)
         class_names = ["Jeffrey", "Sonia", "Sonia_ID"]
-        self.logger.info(f"Simulated classification: {class_names[max_idx]} with probability {predictions[max_idx]:.4f}")
+        self.logger.debug("Simulated classification: %s with probability %.4f", class_names[max_idx], predictions[max_idx])
         
         return predictions
 
@@ -247,6 +442,14 @@ class VisionSystem:
         self.logger = logging.getLogger("Vision")
         self.config = config
         
+        # Use optimized kernels and cap OpenCV's thread pool, leaving cores for TFLite and network IO
+        # 啟用優化內核並限制 OpenCV 線程池，為 TFLite 和網絡IO保留核心
+        cv2.setUseOptimized(True)
+        opencv_threads = config.get("opencv_threads", max(1, (os.cpu_count() or 1) // 2))
+        cv2.setNumThreads(opencv_threads)
+        self.logger.info(f"OpenCV threads: {opencv_threads}")
+        self.logger.info(f"OpenCV 線程數: {opencv_threads}")
+        
         # Automatically select camera index based on platform
         default_camera = 1 if platform.system() == "Linux" and os.path.exists("/etc/rpi-issue") else 0
         self.logger.info(f"Detected platform: {platform.system()}, using default camera index: {default_camera}")
@@ -258,33 +461,62 @@ class VisionSystem:
         
         self.frame_width = config.get("frame_width", 640)
         self.frame_height = config.get("frame_height", 480)
+        self.camera_fourcc = config.get("camera_fourcc", "MJPG")  # 攝像頭輸出格式，空字符串表示使用驅動默認值
         self.confidence_threshold = config.get("confidence_threshold", 0.9)  # 提高置信度閾值到 90%
+        self.id_confidence_threshold = config.get("id_confidence_threshold", self.confidence_threshold)  # 整幀學生證檢查的閾值
         
         # Initialize status variables
 # 初始化狀態變數
         self.running = False
         self.camera = None
         self.latest_frame = None
-        self.latest_data = {
-            "timestamp": 0,
-            "face_detected": False,
-            "face_x": 0.5,  # 歸一化座標 (0-1)
-            "face_y": 0.5,  # 歸一化座標 (0-1)
-            "recognized_person": None,
-            "student_id_detected": False,
-            "confidence": 0.0
-        }
         
-        # Initialize face detector
-# 初始化人臉檢測器
-        self.face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+        # Double buffer: the capture thread decodes into the back buffer, then swaps it to the front
+        # 雙緩衝：採集線程解碼到後緩衝區，然後與前緩衝區交換
+        self._buffers = [None, None]
+        self._front_idx = 0
+        
+        # Set when the camera ignores the requested size: frames are decoded into _raw_frame, then downscaled
+        # 攝像頭不接受請求的尺寸時設置：幀先解碼到 _raw_frame，再縮小
+        self._scale_size = None
+        self._raw_frame = None
+        
+        self.latest_data = VisionData(
+            timestamp=0,
+            face_detected=False,
+            face_x=0.5,  # 歸一化座標 (0-1)
+            face_y=0.5,  # 歸一化座標 (0-1)
+            recognized_person=None,
+            student_id_detected=False,
+            confidence=0.0
+        )
+        # Result of the last classification, kept through brief detection dropouts
+        # 上一次分類的結果，在短暫檢測丟失期間保留
+        self._last_classified = self.latest_data
+        
+        # Initialize face detector: YuNet when its ONNX model is available, Haar cascade otherwise
+# 初始化人臉檢測器：有 YuNet ONNX 模型時使用 YuNet，否則使用 Haar 級聯分類器
+        self.face_detector = None
+        self.face_cascade = None
+        self._detector_size = (self.frame_width, self.frame_height)
+        yunet_path = config.get("face_detector_model", "models/face_detection_yunet_2023mar.onnx")
+        if hasattr(cv2, "FaceDetectorYN") and os.path.exists(yunet_path):
+            try:
+                self.face_detector = cv2.FaceDetectorYN.create(yunet_path, "", self._detector_size, 0.6, 0.3, 5000)
+                self.logger.info(f"Using YuNet face detector: {yunet_path}")
+                self.logger.info(f"使用 YuNet 人臉檢測器: {yunet_path}")
+            except cv2.error as e:
+                self.logger.warning(f"Cannot load YuNet face detector, falling back to Haar cascade: {e}")
+                self.logger.warning(f"無法載入 YuNet 人臉檢測器，回退到 Haar 級聯分類器: {e}")
+        if self.face_detector is None:
+            self.face_cascade = _get_face_cascade()
         
         # Load AI model
 # 載入AI模型
         self.logger.info("載入AI識別模型...")
         self.logger.info("Loading AI recognition model...")
         model_path = config.get("model_path", "models/teachable_machine_model.tflite")
-        self.model = TFLiteModel(model_path)
+        self.model = TFLiteModel(model_path, config.get("model_threads"))
         
         # Load labels from file
 # 從文件中載入標籤
@@ -334,11 +566,34 @@ class VisionSystem:
                 "matthew_id"     # Matthew's student ID / Matthew的學生證
             ]
         
-        # Processing thread
-# 處理線程
+        # Resolve each label once so classification is a list lookup
+# 預先解析每個標籤，分類時只需查表
+        self._label_kinds = [_classify_label(name) for name in self.class_names]
+        # Student ID labels, checked on the whole frame when the face crop is inconclusive
+        # 學生證標籤，人臉裁剪區域結果不確定時在整幀上檢查
+        self._id_label_mask = np.array([kind in (LabelKind.KNOWN_ID, LabelKind.OTHER_ID)
+                                        for kind in self._label_kinds], dtype=bool)
+        
+        # Capture and analysis threads
+# 採集和分析線程
         self.thread = None
+        self.analyze_thread = None
         self.lock = threading.Lock()
         
+        # Single-slot buffer holding the newest frame for the analysis thread, older frames are dropped
+        # 為分析線程保存最新幀的單槽緩衝區，舊幀直接丟棄
+        self._frame_slot = None
+        self._frame_event = threading.Event()
+        
+        # Frames are only decoded when someone needs them, the rest are grabbed and dropped
+        # 只有在需要時才解碼幀，其餘幀只抓取後丟棄
+        self._frame_requested = True
+        self._analysis_pending = False
+        
+        # Callbacks notified from the capture thread on every new frame
+        # 每當有新幀時由採集線程通知的回調
+        self.frame_listeners = []
+        
         self.logger.info("Vision system initialization complete")
         self.logger.info("視覺系統初始化完成")
     
@@ -354,22 +609,56 @@ class VisionSystem:
         # Open camera
         # 打開攝像頭
         self.camera = cv2.VideoCapture(self.camera_index)
+        
+        # Request compressed MJPG frames, so USB bandwidth doesn't cap the frame rate at 640x480
+        # 請求 MJPG 壓縮幀，避免 USB 帶寬限制 640x480 的幀率
+        if self.camera_fourcc:
+            self.camera.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self.camera_fourcc))
         self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, self.frame_width)
         self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, self.frame_height)
         
+        # Keep only the newest frame in the driver buffer
+        # 驅動緩衝區只保留最新一幀
+        self.camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        
         if not self.camera.isOpened():
             self.logger.error("Cannot open camera")
             self.logger.error("無法打開攝像頭")
             return
+        
+        # Check the size the driver actually delivers, scaling on the device is free while a resize is a full-frame pass
+        # 檢查驅動實際提供的尺寸，設備端縮放不佔CPU，而軟件縮放需要處理整幀
+        actual_width = int(self.camera.get(cv2.CAP_PROP_FRAME_WIDTH))
+        actual_height = int(self.camera.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        if actual_width > 0 and (actual_width, actual_height) != (self.frame_width, self.frame_height):
+            if actual_width > self.frame_width or actual_height > self.frame_height:
+                # Larger than requested: downscale each frame with INTER_AREA to fit the requested size,
+                # keeping the camera's aspect ratio so faces are not squashed (e.g. 1280x720 -> 640x360)
+                # 比請求的大：每幀使用 INTER_AREA 縮小到請求尺寸以內，
+                # 保持攝像頭的寬高比，避免人臉被壓扁（例如 1280x720 -> 640x360）
+                scale = min(self.frame_width / actual_width, self.frame_height / actual_height)
+                self.frame_width = max(1, round(actual_width * scale))
+                self.frame_height = max(1, round(actual_height * scale))
+                self._scale_size = (self.frame_width, self.frame_height)
+            else:
+                # Smaller than requested: use it as is rather than upscaling
+                # 比請求的小：直接使用，不放大
+                self.frame_width, self.frame_height = actual_width, actual_height
+            self.logger.warning(f"Camera delivers {actual_width}x{actual_height}, using {self.frame_width}x{self.frame_height}")
+            self.logger.warning(f"攝像頭提供 {actual_width}x{actual_height}，使用 {self.frame_width}x{self.frame_height}")
             
         self.running = True
         
-        # Start processing thread
-        # 啟動處理線程
-        self.thread = threading.Thread(target=self._process_frames)
+        # Start capture thread and analysis thread
+        # 啟動採集線程和分析線程
+        self.thread = threading.Thread(target=self._capture_loop)
         self.thread.daemon = True
         self.thread.start()
         
+        self.analyze_thread = threading.Thread(target=self._analyze_loop)
+        self.analyze_thread.daemon = True
+        self.analyze_thread.start()
+        
         self.logger.info("Vision system started")
         self.logger.info("視覺系統已啟動")
     
@@ -385,6 +674,8 @@ class VisionSystem:
         
         if self.thread:
             self.thread.join(timeout=1.0)
+        if self.analyze_thread:
+            self.analyze_thread.join(timeout=1.0)
             
         if self.camera:
             self.camera.release()
@@ -393,84 +684,219 @@ class VisionSystem:
         self.logger.info("Vision system stopped")
         self.logger.info("視覺系統已停止")
     
-    def _process_frames(self):
-        """Main loop for processing camera frames
-處理攝像頭幀的主循環"""
-        last_classification_time = 0
-        classification_interval = 3.0  # 每3秒分類一次
+    def add_frame_listener(self, callback):
+        """Register a callback invoked with each new camera frame
         
-        while self.running:
-            current_time = time.time()
+        Args:
+            callback (callable): Called as callback(frame) from the capture thread,
+                the frame buffer is reused so copy it to keep it
             
-            # Read a frame
-            # 讀取一幀
-            ret, frame = self.camera.read()
-            if not ret or frame is None:
+        註冊一個在每個新攝像頭幀時調用的回調
+        
+        Args:
+            callback (callable): 由採集線程以 callback(frame) 調用，
+                幀緩衝區會被重用，如需保留請複製
+        """
+        self.frame_listeners.append(callback)
+    
+    def _capture_loop(self):
+        """Capture loop, keeps reading camera frames so the driver buffer never goes stale
+採集循環，持續讀取攝像頭幀，避免驅動緩衝區中的幀過時"""
+        # Keep capture and detection off the core used by network IO
+        # 將採集和檢測放在網絡IO核心以外的核心上
+        pin_current_thread(worker_cores(), self.logger)
+        
+        while self.running:
+            # Grab a frame without decoding it, blocks at the camera frame rate
+            # 抓取一幀但不解碼，按攝像頭幀率阻塞
+            if not self.camera.grab():
                 self.logger.warning("Cannot read camera frame")
                 self.logger.warning("無法讀取攝像頭幀")
                 time.sleep(0.1)
                 continue
-                
-            # Update latest frame
-            # 更新最新幀
+            
+            # Only decode when the analysis thread, a listener or get_latest_frame needs the frame
+            # 只有在分析線程、監聽器或 get_latest_frame 需要時才解碼
+            # Clear each flag only when it was read as set, so a request made after the read is not lost
+            # 只清除讀取時已設置的標誌，避免丟失讀取之後發出的請求
+            analysis_pending = self._analysis_pending
+            frame_requested = self._frame_requested
+            if not (analysis_pending or frame_requested or self.frame_listeners):
+                continue
+            if analysis_pending:
+                self._analysis_pending = False
+            if frame_requested:
+                self._frame_requested = False
+            
+            # Decode into the back buffer, no per-frame allocation or copy
+            # 解碼到後緩衝區，無需每幀分配或複製內存
+            back_idx = 1 - self._front_idx
+            if self._scale_size is None:
+                ret, frame = self.camera.retrieve(self._buffers[back_idx])
+                if not ret or frame is None:
+                    continue
+            else:
+                ret, raw = self.camera.retrieve(self._raw_frame)
+                if not ret or raw is None:
+                    continue
+                self._raw_frame = raw
+                frame = cv2.resize(raw, self._scale_size, dst=self._buffers[back_idx], interpolation=cv2.INTER_AREA)
+            self._buffers[back_idx] = frame
+            
+            # Swap buffers; the analysis thread gets its own copy since it holds the frame for a while
+            # 交換緩衝區；分析線程會長時間持有幀，因此獲得獨立副本
             with self.lock:
-                self.latest_frame = frame.copy()
-            
-            # 只在指定間隔時間進行分類
-            if current_time - last_classification_time >= classification_interval:
-                # Process frame
-                # 處理幀
-                self._analyze_frame(frame)
-                last_classification_time = current_time
-                self.logger.info(f"Classification performed at {datetime.now().strftime('%H:%M:%S')}")
-            
-            # Control frame capture frequency
-            # 控制幀捕獲頻率
-            time.sleep(0.03)  # 約30fps的幀捕獲率
+                self._front_idx = back_idx
+                self.latest_frame = frame
+                if analysis_pending:
+                    self._frame_slot = frame.copy()
+            if analysis_pending:
+                self._frame_event.set()
+            
+            # Notify frame listeners, the frame is reused after the next swap so listeners copy what they keep
+            # 通知幀監聽器，該幀在下次交換後會被重用，監聽器需自行複製要保留的幀
+            for listener in self.frame_listeners:
+                listener(frame)
     
-    def _analyze_frame(self, frame):
-        """Analyze a frame
+    def _analyze_loop(self):
+        """Analysis loop, runs detection and classification on the newest frame
+分析循環，對最新幀進行檢測和分類"""
+        pin_current_thread(worker_cores(), self.logger)
+        
+        last_detection_time = 0
+        detection_interval = 0.1  # 人臉檢測約10Hz (Face detection at about 10 Hz)
+        last_classification_time = 0
+        classification_interval = 3.0  # 每3秒分類一次
+        face_lost_passes = 5  # 人臉需連續消失5次（約0.5秒）才算離開 (Face must be missing for 5 passes, about 0.5 s, to count as gone)
+        missed_passes = face_lost_passes  # 連續未檢測到人臉的次數 (Consecutive passes without a face)
+        
+        while self.running:
+            # 只在指定間隔時間進行檢測
+            wait_time = last_detection_time + detection_interval - time.monotonic()
+            if wait_time > 0:
+                time.sleep(wait_time)
+                continue
+            
+            # Ask the capture thread for a fresh frame and wait for it
+            # 請求採集線程提供新幀並等待
+            with self.lock:
+                self._frame_slot = None
+            self._frame_event.clear()
+            self._analysis_pending = True
+            if not self._frame_event.wait(timeout=0.1):
+                continue
+            self._frame_event.clear()
+            with self.lock:
+                frame = self._frame_slot
+                self._frame_slot = None
+            if frame is None:
+                continue
+            
+            # Cheap face detection on every pass, the model only runs when a face newly appears
+            # or the classification interval has elapsed with a face present; a face only counts as new
+            # after it was missing for several passes, so flickering detections don't bypass the interval
+            # 每次都進行低成本的人臉檢測，只有在人臉新出現或分類間隔已過且有人臉時才運行模型；
+            # 人臉連續消失數次後再出現才算新人臉，避免檢測結果閃爍時繞過分類間隔
+            last_detection_time = time.monotonic()
+            faces = self._detect_faces(frame)
+            face_detected = len(faces) > 0
+            classify = face_detected and (missed_passes >= face_lost_passes or
+                                          last_detection_time - last_classification_time >= classification_interval)
+            missed_passes = 0 if face_detected else missed_passes + 1
+            
+            # Process frame
+            # 處理幀
+            self._analyze_frame(frame, faces, classify)
+            if classify:
+                last_classification_time = last_detection_time
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info("Classification performed at %s", time.strftime('%H:%M:%S'))
+    
+    def _detect_faces(self, frame):
+        """Detect faces in a frame
         
         Args:
-            frame: The image frame to analyze
+            frame: BGR image frame
             
-        分析一幀圖像
+        Returns:
+            Face boxes as (x, y, w, h) in frame coordinates
+            
+        檢測幀中的人臉
         
         Args:
-            frame: 要分析的圖像幀
+            frame: BGR 圖像幀
+            
+        Returns:
+            幀座標中的人臉框 (x, y, w, h)
         """
+        if self.face_detector is not None:
+            # YuNet works on the colour frame directly, only the input size has to match
+            # YuNet 直接處理彩色幀，只需輸入尺寸匹配
+            size = (frame.shape[1], frame.shape[0])
+            if size != self._detector_size:
+                self.face_detector.setInputSize(size)
+                self._detector_size = size
+            _, faces = self.face_detector.detect(frame)
+            if faces is None:
+                return ()
+            return faces[:, :4].astype(np.int32)
+        
         # Convert to grayscale for face detection
         # 轉換為灰度圖像用於人臉檢測
         gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
         
-        # Detect faces (still used for face position tracking)
-        # 檢測人臉（仍用於人臉位置追蹤）
+        # Detect on a half-resolution image, the cascade walks 4x fewer pixels
+        # 在半分辨率圖像上檢測，級聯分類器處理的像素減少4倍
+        small = cv2.resize(gray, (gray.shape[1] // 2, gray.shape[0] // 2), interpolation=cv2.INTER_AREA)
+        
+        # scaleFactor 1.2 roughly halves the number of pyramid levels compared to 1.1
+        # scaleFactor 1.2 比 1.1 大約減少一半的金字塔層數
         faces = self.face_cascade.detectMultiScale(
-            gray, 
-            scaleFactor=1.1, 
+            small, 
+            scaleFactor=1.2, 
             minNeighbors=5, 
-            minSize=(30, 30)
+            minSize=(15, 15)
         )
         
-        # Initialize data dictionary
-        # 初始化數據字典
-        data = {
-            "timestamp": time.time(),
-            "face_detected": len(faces) > 0,
-            "face_x": 0.5,  # Default center
-            "face_y": 0.5,  # Default center
-            "recognized_person": None,
-            "student_id_detected": False,
-            "confidence": 0.0
-        }
+        # Scale boxes back to full-resolution coordinates
+        # 將檢測框縮放回全分辨率座標
+        if len(faces) > 0:
+            faces = faces * 2
+        return faces
+    
+    def _analyze_frame(self, frame, faces, classify):
+        """Analyze a frame
+        
+        Args:
+            frame: The image frame to analyze
+            faces: Face boxes from _detect_faces
+            classify (bool): Run the recognition model, otherwise keep the previous result
+            
+        分析一幀圖像
+        
+        Args:
+            frame: 要分析的圖像幀
+            faces: _detect_faces 返回的人臉框
+            classify (bool): 是否運行識別模型，否則沿用上一次的結果
+        """
+        # Initialize vision data
+        # 初始化視覺數據
+        data = VisionData(
+            timestamp=time.time(),
+            face_detected=len(faces) > 0,
+            face_x=0.5,  # Default center
+            face_y=0.5,  # Default center
+            recognized_person=None,
+            student_id_detected=False,
+            confidence=0.0
+        )
         
         # If no faces detected, return early
         # 如果沒有檢測到人臉，提前返回
         if len(faces) == 0:
             # Update latest data
             # 更新最新數據
-            with self.lock:
-                self.latest_data = data
+            self.latest_data = data
             return
             
         # Process the largest face
@@ -485,18 +911,32 @@ class VisionSystem:
         face_center_y = (y + h/2) / frame_h
         face_center_x = max(0.0, min(1.0, face_center_x))
         face_center_y = max(0.0, min(1.0, face_center_y))
-        data["face_x"] = face_center_x
-        data["face_y"] = face_center_y
-        # English: Save normalized face center position to data dict for downstream tracking
-        # 中文：將正規化的人臉中心位置寫入 data 字典，供後續追蹤用
+        data.face_x = float(face_center_x)
+        data.face_y = float(face_center_y)
+        # English: Save normalized face center position to data for downstream tracking
+        # 中文：將正規化的人臉中心位置寫入 data，供後續追蹤用
         
-        # Resize frame to match model input size
-        # 調整幀大小以匹配模型輸入大小
-        resized_frame = cv2.resize(frame, (224, 224))
+        # Between classifications keep the last recognition result for the same face
+        # 兩次分類之間，同一張人臉沿用上一次的識別結果
+        if not classify:
+            previous = self._last_classified
+            data.recognized_person = previous.recognized_person
+            data.student_id_detected = previous.student_id_detected
+            data.confidence = previous.confidence
+            self.latest_data = data
+            return
+        
+        # Crop the face with 20% padding so face labels are scored on the face rather than the whole scene
+        # 以 20% 邊距裁剪人臉，使人臉標籤基於人臉而非整個場景評分
+        frame_h_px, frame_w_px = frame.shape[:2]
+        pad_x, pad_y = w // 5, h // 5
+        x0, y0 = max(0, x - pad_x), max(0, y - pad_y)
+        x1, y1 = min(frame_w_px, x + w + pad_x), min(frame_h_px, y + h + pad_y)
+        face_crop = frame[y0:y1, x0:x1]
         
-        # Get model predictions
-        # 獲取模型預測
-        predictions = self.model.predict(resized_frame)
+        # Get model predictions for the face crop
+        # 獲取人臉裁剪區域的模型預測
+        predictions = self.model.predict(self._resize_for_model(face_crop))
         
         # Find the class with highest probability
         # 找到概率最高的類別
@@ -505,142 +945,72 @@ class VisionSystem:
         
         # Check if confidence is above threshold
         # 檢查置信度是否高於閾值
-        if max_prob >= self.confidence_threshold:
+        accepted = max_prob >= self.confidence_threshold
+        
+        # A student ID card held up next to the face is almost never inside the crop: only when the face
+        # result is inconclusive, run a separate whole-frame pass that may only pick an ID label
+        # 舉在臉旁的學生證幾乎不會落在裁剪區域內：僅在人臉結果不確定時，對整幀另行分類，且只接受學生證標籤
+        if not accepted and self._id_label_mask.any():
+            frame_probs = np.asarray(self.model.predict(self._resize_for_model(frame)))
+            id_idx = int(np.argmax(np.where(self._id_label_mask, frame_probs, -1.0)))
+            if frame_probs[id_idx] >= self.id_confidence_threshold:
+                max_prob_idx, max_prob = id_idx, frame_probs[id_idx]
+                accepted = True
+        
+        if accepted:
             class_name = self.class_names[max_prob_idx]
             self.logger.info(f"Recognized class: {class_name}, index: {max_prob_idx}, probability: {max_prob:.4f}")
             self.logger.info(f"識別出的類別: {class_name}, 索引: {max_prob_idx}, 概率: {max_prob:.4f}")
             
             # 只將 Sonia 視為已知人員，其他人都視為未知人員
-            if "sonia" in class_name.lower() and "id" not in class_name.lower() and "card" not in class_name.lower():
+            kind = self._label_kinds[max_prob_idx]
+            if kind is LabelKind.KNOWN_FACE:
                 self.logger.info("Recognized Sonia as known person")
                 self.logger.info("識別出 Sonia 為已知人員")
-                data["recognized_person"] = "Sonia"
-            else:
-                # Jeffrey 和其他人都視為未知人員
-                if "jeffrey" in class_name.lower():
-                    self.logger.info("Jeffrey is treated as unknown person")
-                    self.logger.info("Jeffrey 被視為未知人員")
-                    # 確保 recognized_person 是 None，使 mode_manager 將其視為未知人員
-                    data["recognized_person"] = None
-            
-            # 檢查是否識別出學生證
-            if "id" in class_name.lower() or "card" in class_name.lower():
+                data.recognized_person = "Sonia"
+            elif kind is LabelKind.KNOWN_ID:
+                # 只有 Sonia 的學生證才被認可
+                self.logger.info("Recognized Sonia's student ID")
+                self.logger.info("識別出 Sonia 的學生證")
+                data.recognized_person = "Sonia"
+                data.student_id_detected = True
+            elif kind is LabelKind.OTHER_ID:
                 self.logger.info(f"Detected student ID card: {class_name}")
                 self.logger.info(f"檢測到學生證: {class_name}")
-                
-                # 只有 Sonia 的學生證才被認可
-                if "sonia" in class_name.lower():
-                    self.logger.info("Recognized Sonia's student ID")
-                    self.logger.info("識別出 Sonia 的學生證")
-                    data["recognized_person"] = "Sonia"
-                    data["student_id_detected"] = True
-                
-                # Special case for test model: only Sonia is recognized as known person
-                # 測試模型的特殊情況：只有 Sonia 被識別為已知人員
-                if class_name == "Sonia":
-                    data["recognized_person"] = "Sonia"
-                elif class_name == "Sonia_ID":
-                    data["recognized_person"] = "Sonia"
-                    data["student_id_detected"] = True
-                elif class_name == "Jeffrey":
-                    # 確保 Jeffrey 被視為未知人員
-                    self.logger.info("Jeffrey is treated as unknown person (special case)")
-                    self.logger.info("Jeffrey 被視為未知人員（特殊情況）")
-                    data["recognized_person"] = None
-            
-            data["confidence"] = float(max_prob)
-        
-        # Update latest data
-        # 更新最新數據
-        with self.lock:
-            self.latest_data = data
-    
-    def get_latest_data(self):
-        """Get the latest vision data
-        
-        Returns:
-            dict: The latest vision data
+            else:
+                # Jeffrey 和其他人都視為未知人員，recognized_person 保持 None，使 mode_manager 將其視為未知人員
+                self.logger.info(f"{class_name} is treated as unknown person")
+                self.logger.info(f"{class_name} 被視為未知人員")
             
-        獲取最新的視覺數據
+            data.confidence = float(max_prob)
         
-        Returns:
-            dict: 最新的視覺數據
-        """
-        with self.lock:
-            return self.latest_data.copy()
+        # Publish latest data; the object is never modified after this, so readers need no lock
+        # 發布最新數據；此後不再修改該對象，讀取方無需加鎖
+        self.latest_data = data
+        self._last_classified = data
     
-    def get_latest_frame(self):
-        """Get the latest camera frame
+    def _resize_for_model(self, image):
+        """Resize an image to the 224x224 model input
         
-        Returns:
-            numpy.ndarray: The latest camera frame, or None if not available
+        Args:
+            image: Input image
             
-        獲取最新的攝像頭幀
-        
-        Returns:
-            numpy.ndarray: 最新的攝像頭幀，如果沒有則返回None
-        """
-        with self.lock:
-            if self.latest_frame is None:
-                return None
-            return self.latest_frame.copy()
-    
-    def get_timestamp(self):
-        """Get the timestamp of the latest data
-        
         Returns:
-            float: Timestamp
+            numpy.ndarray: Resized image
             
-        獲取最新數據的時間戳
-        
-        Returns:
-            float: 時間戳
-        """
-        with self.lock:
-            return self.latest_data["timestamp"]
-    
-    def get_status(self):
-        """Get vision system status
-        獲取視覺系統狀態
+        將圖像縮放到 224x224 的模型輸入大小
         
+        Args:
+            image: 輸入圖像
+            
         Returns:
-            dict: Vision system status
-            dict: 視覺系統狀態
+            numpy.ndarray: 縮放後的圖像
         """
-        with self.lock:
-            latest_data = self.latest_data
-            # 首先記錄最新数据中的值
-            # First log the values in the latest data
-            self.logger.info(f"VisionSystem.get_status: latest_data = {latest_data}")
-            
-            # 初始化狀態字典
-            # Initialize status dictionary
-            status = {
-                "camera_active": self.camera is not None and self.camera.isOpened(),
-                "resolution": f"{self.frame_width}x{self.frame_height}",
-                "face_detected": latest_data["face_detected"],
-                "recognized_person": latest_data["recognized_person"],
-                "student_id_detected": latest_data["student_id_detected"],
-                "confidence": latest_data["confidence"]
-            }
-            
-            # 添加人臉座標
-            # Add face coordinates
-            if "face_x" in latest_data and "face_y" in latest_data:
-                try:
-                    status["face_x"] = latest_data["face_x"]
-                    status["face_y"] = latest_data["face_y"]
-                    self.logger.info(f"VisionSystem.get_status: 添加人臉座標到狀態中: x={status['face_x']:.2f}, y={status['face_y']:.2f}")
-                    self.logger.info(f"VisionSystem.get_status: Adding face coordinates to status: x={status['face_x']:.2f}, y={status['face_y']:.2f}")
-                except Exception as e:
-                    self.logger.error(f"VisionSystem.get_status: 提取人臉座標時出錯: {e}")
-                    self.logger.error(f"VisionSystem.get_status: Error extracting face coordinates: {e}")
-            else:
-                self.logger.warning("VisionSystem.get_status: latest_data 中沒有人臉座標信息")
-                self.logger.warning("VisionSystem.get_status: No face coordinates in latest_data")
-            
-            self.logger.info(f"VisionSystem.get_status: 返回狀態 = {status}")
-            return status
+        # A small face crop can be under 224 pixels, enlarge it with INTER_LINEAR
+        # 人臉較小時裁剪區域可能小於 224，此時放大使用 INTER_LINEAR
+        shrinking = image.shape[0] > 224 or image.shape[1] > 224
+        return cv2.resize(image, (224, 224),
+                          interpolation=cv2.INTER_AREA if shrinking else cv2.INTER_LINEAR)
     
     def get_latest_data(self):
         """Get the latest vision data
@@ -653,8 +1023,7 @@ class VisionSystem:
         Returns:
             dict: 最新的視覺數據
         """
-        with self.lock:
-            return self.latest_data.copy()
+        return self.latest_data.to_dict()
     
     def get_latest_frame(self):
         """Get the latest camera frame
@@ -667,6 +1036,7 @@ class VisionSystem:
         Returns:
             numpy.ndarray: 最新的攝像頭幀，如果沒有則返回None
         """
+        self._frame_requested = True
         with self.lock:
             if self.latest_frame is None:
                 return None
@@ -683,7 +1053,33 @@ class VisionSystem:
         Returns:
             float: 時間戳
         """
-        with self.lock:
-            return self.latest_data["timestamp"]
+        return self.latest_data.timestamp
     
-    
\ No newline at end of file
+    def get_status(self):
+        """Get vision system status
+        獲取視覺系統狀態
+        
+        Returns:
+            dict: Vision system status
+            dict: 視覺系統狀態
+        """
+        latest_data = self.latest_data
+        # 首先記錄最新数据中的值
+        # First log the values in the latest data
+        self.logger.debug("VisionSystem.get_status: latest_data = %s", latest_data)
+        
+        # 初始化狀態字典，包含人臉座標
+        # Initialize status dictionary, including face coordinates
+        status = {
+            "camera_active": self.camera is not None and self.camera.isOpened(),
+            "resolution": f"{self.frame_width}x{self.frame_height}",
+            "face_detected": latest_data.face_detected,
+            "recognized_person": latest_data.recognized_person,
+            "student_id_detected": latest_data.student_id_detected,
+            "confidence": latest_data.confidence,
+            "face_x": latest_data.face_x,
+            "face_y": latest_data.face_y
+        }
+        
+        self.logger.debug("VisionSystem.get_status: 返回狀態 = %s", status)
+        return status
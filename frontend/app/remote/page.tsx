@@ -23,12 +23,13 @@ import {
 } from "lucide-react"
 import Navigation from "@/components/navigation"
 import useRobotConnection from "@/hooks/useRobotConnection"
+import { loadVideoFrame } from "@/lib/video-frame"
 
 // 定義消息類型介面
 interface RobotMessage {
   type: string;
   data?: {
-    image?: string;
+    image?: Blob;
     timestamp?: number;
     width?: number;
     height?: number;
@@ -46,6 +47,14 @@ interface RobotMessage {
   id?: string;
 }
 
+// 將幀時間戳（秒）格式化為 YYYY-MM-DD HH:MM:SS.mmm
+const formatFrameTime = (timestamp: number) => {
+  const d = new Date(timestamp * 1000);
+  const pad = (n: number, width = 2) => String(n).padStart(width, '0');
+  return `${d.getFullYear()}-${pad(d.getMonth() + 1)}-${pad(d.getDate())} ` +
+    `${pad(d.getHours())}:${pad(d.getMinutes())}:${pad(d.getSeconds())}.${pad(d.getMilliseconds(), 3)}`;
+};
+
 export default function RemoteMode() {
   const [videoActive, setVideoActive] = useState(true)
   const [zoomLevel, setZoomLevel] = useState(1)
@@ -154,6 +163,16 @@ export default function RemoteMode() {
     }
     
     ctx.restore();
+    
+    // 繪製相機標題和時間戳（服務器不再將其繪製到畫面中）
+    if (typedLastMessage && typedLastMessage.data && typedLastMessage.data.timestamp !== undefined) {
+      ctx.font = '16px Arial';
+      ctx.textAlign = 'left';
+      ctx.fillStyle = 'rgb(255, 200, 100)';
+      ctx.fillText('MaoMao Robot Camera', 20, 30);
+      ctx.fillStyle = 'rgb(255, 255, 255)';
+      ctx.fillText(`Time: ${formatFrameTime(typedLastMessage.data.timestamp)}`, 20, 60);
+    }
   };
   
   // 處理視頻幀
@@ -166,13 +185,13 @@ export default function RemoteMode() {
     if (!canvas) return;
     
     try {
-      const imageData = typedLastMessage.data.image;
-      if (!imageData) return;
+      const frame = typedLastMessage.data;
+      if (!frame.image) return;
       
       const image = new Image();
       image.onload = () => handleImageLoad(image, canvas);
       image.onerror = (err) => console.error('圖像加載錯誤:', err);
-      image.src = `data:image/jpeg;base64,${imageData}`;
+      loadVideoFrame(image, frame);
     } catch (error) {
       console.error('處理視頻幀時出錯:', error);
     }
@@ -1,6 +1,7 @@
 "use client"
 
 import { useState, useEffect, useRef } from "react"
+import { parseVideoFrame, loadVideoFrame } from "@/lib/video-frame"
 
 export default function VideoBasicPage() {
   const [connected, setConnected] = useState(false)
@@ -33,7 +34,7 @@ export default function VideoBasicPage() {
     }
     
     try {
-      addLog("正在連接到測試視頻服務器...");
+      addLog("正在連接到機器人視頻服務器...");
       console.log('嘗試連接到 WebSocket 服務器...');
       
       // 確保 WebSocket 在瀏覽器環境中可用
@@ -42,12 +43,14 @@ export default function VideoBasicPage() {
         return;
       }
       
-      const ws = new WebSocket("ws://localhost:8766");
+      const ws = new WebSocket("ws://localhost:8765");
+      // 視頻幀是帶頭部的二進制消息
+      ws.binaryType = "arraybuffer";
       wsRef.current = ws;
       
       ws.onopen = () => {
         console.log('已連接到 WebSocket 服務器');
-        addLog("已連接到測試視頻服務器");
+        addLog("已連接到機器人視頻服務器");
         setConnected(true);
       };
       
@@ -65,10 +68,12 @@ export default function VideoBasicPage() {
       
       ws.onmessage = (event) => {
         try {
-          const data = JSON.parse(event.data);
-          
-          if (data.type === "video_frame" && data.data && data.data.image) {
-            const imgData = data.data;
+          if (event.data instanceof ArrayBuffer) {
+            const imgData = parseVideoFrame(event.data);
+            if (!imgData) {
+              addLog("收到無效的二進制視頻幀");
+              return;
+            }
             console.log(`收到視頻幀: ${imgData.width}x${imgData.height}`);
             addLog(`收到視頻幀: ${imgData.width}x${imgData.height}`);
             
@@ -110,9 +115,10 @@ export default function VideoBasicPage() {
               ctx.fillText("圖像加載失敗", canvas.width/2, canvas.height/2);
             };
             
-            // 設置圖像源
-            img.src = `data:image/jpeg;base64,${imgData.image}`;
+            // 設置圖像源，對象 URL 在圖像載入後釋放
+            loadVideoFrame(img, imgData);
           } else {
+            const data = JSON.parse(event.data);
             addLog(`收到消息: ${data.type}`);
           }
         } catch (error) {
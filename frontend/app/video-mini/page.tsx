@@ -1,6 +1,7 @@
 "use client"
 
 import { useState, useEffect, useRef } from "react"
+import { parseVideoFrame, loadVideoFrame } from "@/lib/video-frame"
 
 export default function VideoMiniPage() {
   const [connected, setConnected] = useState(false)
@@ -20,7 +21,9 @@ export default function VideoMiniPage() {
   const connect = () => {
     try {
       addLog("正在連接...")
-      const ws = new WebSocket("ws://localhost:8766")
+      const ws = new WebSocket("ws://localhost:8765")
+      // 視頻幀是帶頭部的二進制消息
+      ws.binaryType = "arraybuffer"
       wsRef.current = ws
       
       ws.onopen = () => {
@@ -40,9 +43,10 @@ export default function VideoMiniPage() {
       
       ws.onmessage = (event) => {
         try {
-          const data = JSON.parse(event.data)
-          
-          if (data.type === "video_frame" && data.data && data.data.image) {
+          if (event.data instanceof ArrayBuffer) {
+            const frame = parseVideoFrame(event.data)
+            if (!frame) return
+            
             // 繪製視頻幀
             const canvas = canvasRef.current
             if (!canvas) return
@@ -55,8 +59,9 @@ export default function VideoMiniPage() {
               ctx.drawImage(img, 0, 0, canvas.width, canvas.height)
             }
             
-            img.src = `data:image/jpeg;base64,${data.data.image}`
+            loadVideoFrame(img, frame)
           } else {
+            const data = JSON.parse(event.data)
             addLog(`收到: ${data.type}`)
           }
         } catch (e) {
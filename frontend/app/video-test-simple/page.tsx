@@ -1,6 +1,7 @@
 "use client"
 
 import { useState, useEffect, useRef } from "react"
+import { parseVideoFrame, loadVideoFrame } from "@/lib/video-frame"
 
 export default function VideoTestPage() {
   const [connected, setConnected] = useState(false)
@@ -20,7 +21,9 @@ export default function VideoTestPage() {
   const connect = () => {
     try {
       addMessage("正在連接到WebSocket服務器...");
-      const ws = new WebSocket("ws://localhost:8766");
+      const ws = new WebSocket("ws://localhost:8765");
+      // 視頻幀是帶頭部的二進制消息
+      ws.binaryType = "arraybuffer";
       wsRef.current = ws;
       
       ws.onopen = () => {
@@ -43,15 +46,17 @@ export default function VideoTestPage() {
       
       ws.onmessage = (event) => {
         try {
-          if (typeof event.data === 'string') {
-            const data = JSON.parse(event.data);
-            
-            if (data.type === "video_frame" && data.data && data.data.image) {
-              // 收到視頻幀，繪製到畫布上
-              drawVideoFrame(data.data);
+          if (event.data instanceof ArrayBuffer) {
+            // 收到視頻幀，繪製到畫布上
+            const frame = parseVideoFrame(event.data);
+            if (frame) {
+              drawVideoFrame(frame);
             } else {
-              addMessage(`收到消息: ${data.type}`);
+              addMessage("收到無效的二進制視頻幀");
             }
+          } else if (typeof event.data === 'string') {
+            const data = JSON.parse(event.data);
+            addMessage(`收到消息: ${data.type}`);
           } else {
             addMessage(`收到非字符串消息: ${typeof event.data}`);
           }
@@ -166,7 +171,7 @@ export default function VideoTestPage() {
     
     console.log("收到視頻幀，準備顯示");
     console.log("視頻幀尺寸:", frameData.width, "x", frameData.height);
-    console.log("視頻幀圖像數據長度:", frameData.image.length);
+    console.log("視頻幀圖像數據長度:", frameData.image.size);
     
     // 創建新圖像
     const img = new Image();
@@ -182,11 +187,6 @@ export default function VideoTestPage() {
       ctx.fillStyle = "#ff4040";
       ctx.textAlign = "center";
       ctx.fillText("視頻幀加載失敗", canvas.width / 2, canvas.height / 2);
-      
-      // 嘗試在錯誤時印出圖像源的一部分以進行診斷
-      if (img.src) {
-        console.log("失敗的圖像源開頭:", img.src.substring(0, 50), "...");
-      }
     };
     
     // 圖像加載成功後繪製
@@ -232,24 +232,10 @@ export default function VideoTestPage() {
       }
     };
     
-    // 設置圖像源為base64編碼的圖像
+    // 設置圖像源為視頻幀的 JPEG，對象 URL 在圖像載入後釋放
     try {
-      // 確保base64字符串有效
-      if (typeof frameData.image === 'string' && frameData.image.length > 0) {
-        console.log("準備設置圖像源...");
-        
-        // 檢查base64字符串是否有效
-        const base64Str = frameData.image;
-        if (base64Str.length < 10) {
-          console.error("無效的Base64字符串，長度太短");
-          return;
-        }
-        
-        img.src = `data:image/jpeg;base64,${base64Str}`;
-        console.log("圖像源已設置");
-      } else {
-        console.error("無效的圖像數據類型:", typeof frameData.image);
-      }
+      loadVideoFrame(img, frameData);
+      console.log("圖像源已設置");
     } catch (error) {
       console.error("設置圖像源時出錯:", error);
     }
@@ -1,6 +1,7 @@
 "use client";
 
 import { useState, useEffect, useRef } from "react";
+import { parseVideoFrame, loadVideoFrame } from "@/lib/video-frame";
 import { Card } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 
@@ -23,9 +24,11 @@ export default function VideoTest() {
         }
       }
       
-      // 連接到測試視頻服務器，使用不同的端口
+      // 連接到機器人的 WebSocket 服務器（backend/config.json 中的 websocket_port）
       addMessage("正在連接到WebSocket服務器...");
-      const ws = new WebSocket("ws://localhost:8766");
+      const ws = new WebSocket("ws://localhost:8765");
+      // 視頻幀是帶頭部的二進制消息
+      ws.binaryType = "arraybuffer";
       wsRef.current = ws;
       
       // 設置連接逾時
@@ -81,18 +84,7 @@ export default function VideoTest() {
             try {
               const data = JSON.parse(event.data);
               
-              if (data.type === "video_frame" && data.data && data.data.image) {
-                const imgLength = data.data.image.length;
-                addMessage(`收到視頻幀: ${data.data.width}x${data.data.height}, 圖像數據長度: ${imgLength} 字節`);
-                
-                // 檢查base64字符串是否有效
-                if (imgLength > 100) {
-                  addMessage(`Base64字符串開頭: ${data.data.image.substring(0, 20)}...`);
-                  drawVideoFrame(data.data.image);
-                } else {
-                  addMessage(`警告: 圖像數據太短，可能不是有效的base64字符串`);
-                }
-              } else if (data.type === "command_response") {
+              if (data.type === "command_response") {
                 addMessage(`收到命令響應: ${JSON.stringify(data.result)}`);
               } else if (data.type === "status_update") {
                 addMessage(`收到狀態更新: ${JSON.stringify(data.data).substring(0, 100)}...`);
@@ -105,13 +97,17 @@ export default function VideoTest() {
               addMessage(`無法解析JSON: ${event.data.substring(0, 50)}...`);
               addMessage(`解析錯誤: ${e}`);
             }
+          } else if (event.data instanceof ArrayBuffer) {
+            // 二進制消息是帶頭部的視頻幀
+            const frame = parseVideoFrame(event.data);
+            if (frame) {
+              addMessage(`收到視頻幀: ${frame.width}x${frame.height}, 圖像數據長度: ${frame.image.size} 字節`);
+              drawVideoFrame(frame);
+            } else {
+              addMessage(`收到無效的二進制視頻幀: ${event.data.byteLength} 字節`);
+            }
           } else {
             addMessage(`收到非字符串消息類型: ${typeof event.data}`);
-            if (event.data instanceof Blob) {
-              addMessage(`Blob大小: ${event.data.size} 字節`);
-            } else if (event.data instanceof ArrayBuffer) {
-              addMessage(`ArrayBuffer大小: ${event.data.byteLength} 字節`);
-            }
           }
         } catch (error) {
           addMessage(`處理消息時出錯: ${error}`);
@@ -284,7 +280,7 @@ export default function VideoTest() {
   };
   
   // 繪製視頻幀
-  const drawVideoFrame = (base64Image: string) => {
+  const drawVideoFrame = (frame: { width: number; height: number; image: Blob }) => {
     if (!canvasRef.current) {
       addMessage("畫布元素不存在，無法繪製視頻幀");
       return;
@@ -297,9 +293,9 @@ export default function VideoTest() {
       return;
     }
     
-    // 檢查base64字符串是否有效
-    if (!base64Image || base64Image.length < 100) {
-      addMessage(`無效的base64圖像數據: 長度為 ${base64Image?.length || 0} 字節`);
+    // 檢查圖像數據是否有效
+    if (!frame.image || frame.image.size === 0) {
+      addMessage("無效的視頻幀圖像數據: 長度為 0 字節");
       
       // 繪製錯誤訊息
       ctx.fillStyle = "#0a1520";
@@ -332,12 +328,6 @@ export default function VideoTest() {
       clearTimeout(imageTimeout);
       addMessage(`圖像加載失敗: ${err}`);
       
-      // 嘗試印出部分base64字符串以進行調試
-      if (base64Image) {
-        addMessage(`Base64字符串開頭: ${base64Image.substring(0, 30)}...`);
-        addMessage(`Base64字符串結尾: ...${base64Image.substring(base64Image.length - 30)}`);
-      }
-      
       // 繪製錯誤訊息
       ctx.fillStyle = "#0a1520";
       ctx.fillRect(0, 0, canvas.width, canvas.height);
@@ -405,11 +395,9 @@ export default function VideoTest() {
       }
     };
     
-    // 設置圖像源為base64編碼的圖像
+    // 設置圖像源為視頻幀的 JPEG，對象 URL 在圖像載入後釋放
     try {
-      // 確保字符串開頭沒有多餘的空格或換行符
-      const cleanBase64 = base64Image.trim();
-      img.src = `data:image/jpeg;base64,${cleanBase64}`;
+      loadVideoFrame(img, frame);
     } catch (error) {
       clearTimeout(imageTimeout);
       addMessage(`設置圖像源時出錯: ${error}`);
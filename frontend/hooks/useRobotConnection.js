@@ -1,4 +1,5 @@
 import { useState, useEffect, useCallback } from 'react';
+import { parseVideoFrame } from '@/lib/video-frame';
 
 const useRobotConnection = (url = 'ws://192.168.1.147:8765') => {
   // 在服務器端渲染時返回預設值
@@ -70,6 +71,7 @@ const useRobotConnection = (url = 'ws://192.168.1.147:8765') => {
         
         // 創建新的WebSocket連接
         ws = new WebSocket(url);
+        ws.binaryType = 'arraybuffer';
         console.log('已創建新的WebSocket連接');
         
         ws.onopen = () => {
@@ -141,54 +143,73 @@ const useRobotConnection = (url = 'ws://192.168.1.147:8765') => {
           if (isUnmounted) return;
           
           try {
-            // 檢查是否是字符串
-            if (typeof event.data !== 'string') {
-              console.log('收到非字符串數據:', typeof event.data);
-              return;
-            }
+            let data;
+            if (event.data instanceof ArrayBuffer) {
+              // 二進制數據是帶頭部的視頻幀
+              const frame = parseVideoFrame(event.data);
+              if (!frame) {
+                console.log('收到無效的二進制視頻幀');
+                return;
+              }
+              data = {
+                type: 'video_frame',
+                data: {
+                  timestamp: frame.timestamp,
+                  width: frame.width,
+                  height: frame.height,
+                  // JPEG Blob，由顯示端通過 loadVideoFrame 載入，對象 URL 在圖像載入後釋放
+                  image: frame.image
+                }
+              };
+            } else {
+              // 檢查是否是字符串
+              if (typeof event.data !== 'string') {
+                console.log('收到非字符串數據:', typeof event.data);
+                return;
+              }
             
-            // 檢查是否為空字符串
-            if (!event.data.trim()) {
-              console.log('收到空消息，已忽略');
-              return;
-            }
+              // 檢查是否為空字符串
+              if (!event.data.trim()) {
+                console.log('收到空消息，已忽略');
+                return;
+              }
             
-            // 處理特殊格式消息
-            // 檢查是否為 JSON 格式
-            const startsWithOpenBrace = event.data.trim().startsWith('{');
-            const startsWithOpenBracket = event.data.trim().startsWith('[');
-            const isPotentialJson = startsWithOpenBrace || startsWithOpenBracket;
+              // 處理特殊格式消息
+              // 檢查是否為 JSON 格式
+              const startsWithOpenBrace = event.data.trim().startsWith('{');
+              const startsWithOpenBracket = event.data.trim().startsWith('[');
+              const isPotentialJson = startsWithOpenBrace || startsWithOpenBracket;
 
-            // 如果不像是 JSON，則直接處理為特殊格式消息
-            if (!isPotentialJson) {
-              // 特殊字符串消息處理
-              if (event.data === 'ping' || event.data === 'pong') {
-                console.log(`收到${event.data}消息`);
-                if (event.data === 'ping') {
-                  try {
-                    ws.send('pong');
-                    console.log('已回覆pong');
-                  } catch (error) {
-                    console.error('發送pong回覆失敗:', error);
+              // 如果不像是 JSON，則直接處理為特殊格式消息
+              if (!isPotentialJson) {
+                // 特殊字符串消息處理
+                if (event.data === 'ping' || event.data === 'pong') {
+                  console.log(`收到${event.data}消息`);
+                  if (event.data === 'ping') {
+                    try {
+                      ws.send('pong');
+                      console.log('已回覆pong');
+                    } catch (error) {
+                      console.error('發送pong回覆失敗:', error);
+                    }
                   }
+                  return;
                 }
+
+                // 其他非 JSON 格式的消息，只進行記錄不嘗試處理
+                console.log('收到非 JSON 格式的消息:', event.data.substring(0, 50) + 
+                  (event.data.length > 50 ? '...' : ''));
                 return;
               }
-
-              // 其他非 JSON 格式的消息，只進行記錄不嘗試處理
-              console.log('收到非 JSON 格式的消息:', event.data.substring(0, 50) + 
-                (event.data.length > 50 ? '...' : ''));
-              return;
-            }
             
-            // 嘗試解析JSON
-            let data;
-            try {
-              data = JSON.parse(event.data);
-            } catch (error) {
-              console.error('消息不是有效的JSON格式:', error);
-              console.log('原始消息前100字符:', event.data.substring(0, 100) + '...');
-              return;
+              // 嘗試解析JSON
+              try {
+                data = JSON.parse(event.data);
+              } catch (error) {
+                console.error('消息不是有效的JSON格式:', error);
+                console.log('原始消息前100字符:', event.data.substring(0, 100) + '...');
+                return;
+              }
             }
             
             // 處理不同類型的消息
@@ -200,7 +221,7 @@ const useRobotConnection = (url = 'ws://192.168.1.147:8765') => {
                   timestamp: data.data.timestamp,
                   width: data.data.width,
                   height: data.data.height,
-                  imageSize: data.data.image ? data.data.image.length : 'N/A'
+                  image_size: data.data.image ? data.data.image.size : 0
                 });
               }
             } else if (data.type === 'status_update' || data.type === 'status') {
@@ -0,0 +1,27 @@
+// 視頻幀二進制頭部（小端序）：魔數 u8、版本 u8、標誌 u16、時間戳毫秒 u64、寬 u16、高 u16、JPEG長度 u32
+const FRAME_MAGIC = 0xf5;
+const FRAME_HEADER_SIZE = 20;
+
+// 解析二進制視頻幀，返回頭部信息和 JPEG 圖像
+export const parseVideoFrame = (buffer) => {
+  if (buffer.byteLength < FRAME_HEADER_SIZE) return null;
+  const view = new DataView(buffer);
+  if (view.getUint8(0) !== FRAME_MAGIC) return null;
+  const jpegLength = view.getUint32(16, true);
+  return {
+    timestamp: Number(view.getBigUint64(4, true)) / 1000,
+    width: view.getUint16(12, true),
+    height: view.getUint16(14, true),
+    image: new Blob([new Uint8Array(buffer, FRAME_HEADER_SIZE, jpegLength)], { type: 'image/jpeg' })
+  };
+};
+
+// 將視頻幀的 JPEG 載入到圖像元素，在圖像載入完成或失敗後才釋放對象 URL
+export const loadVideoFrame = (img, frame) => {
+  const url = URL.createObjectURL(frame.image);
+  const release = () => URL.revokeObjectURL(url);
+  img.addEventListener('load', release, { once: true });
+  img.addEventListener('error', release, { once: true });
+  img.src = url;
+  return url;
+};